@@ -504,7 +504,7 @@ class MainController:
                 # Callback: muestra el diálogo de edición con los datos actuales.
                 def on_success(participantes_ids):
                     self.vista.ocultar_loading()
-                    self.vista.mostrar_dialogo_editar(gasto, participantes_ids, self.modelo.amigos)
+                    self.vista.mostrar_dialogo_gasto(self.modelo.amigos, gasto, participantes_ids)
                 # Callback: muestra error si no se pudieron obtener los participantes.
                 def on_error(error):
                     """Callback: muestra error si no se pudieron obtener los participantes."""
@@ -576,13 +576,15 @@ class MainController:
     
     # MÉTODOS DE PAGOS
     
-    def pagar_saldo(self, amigo_id: int, importe_str: str):
+    def pagar_saldo(self, amigo_id: int, importe: float):
         """
         Registra un pago realizado por un amigo para saldar su deuda.
-        
+
         Este método distribuye el pago entre los gastos pendientes del amigo,
-        actualizando los saldos correspondientes.
-        
+        actualizando los saldos correspondientes. La vista entrega el importe
+        ya convertido a float (o None si el texto no era un número válido),
+        por lo que aquí no hay que parsear cadenas.
+
         Flujo:
         1. Valida que el importe sea válido y mayor que 0
         2. Ejecuta el pago en la API (distribuye entre gastos pendientes)
@@ -591,25 +593,18 @@ class MainController:
         """
         def procesar_pago():
             """Función que se ejecuta en el hilo de fondo. Procesa el pago en la API."""
-            # Validar que el importe no esté vacío y sea mayor que 0
-            if not importe_str.strip():
-                raise ValueError(_("You must enter an amount"))
-            
-            importe = float(importe_str)
-            if importe <= 0:
-                raise ValueError(_("Amount must be greater than 0"))
-            
             # Registrar el pago (distribuye entre gastos pendientes del amigo)
+            # El importe llega ya validado desde el hilo principal
             self.modelo.pagar_saldo(amigo_id, importe)
             return True
-        
+
         def on_success(result):
             """Callback ejecutado en el hilo principal si el pago se registró exitosamente."""
             self.vista.ocultar_loading()
             self.actualizar_datos()  # Recarga todos los datos para actualizar saldos
             # Mostrar mensaje con el importe formateado según el idioma
             self.error_view.mostrar_info(_("Payment of {amount} registered successfully").format(
-                amount=format_currency(float(importe_str))
+                amount=format_currency(importe)
             ))
         
         def on_error(error):
@@ -625,34 +620,30 @@ class MainController:
             else:
                 self.error_view.mostrar_error(_("Error registering payment: {error}").format(error=error_msg))
         
-        try:
-            # Validaciones previas en el hilo principal (sin delay)
-            # Validar que el importe no esté vacío y sea mayor que 0
-            if not importe_str.strip():
-                self.error_view.mostrar_error(_("You must enter an amount"))
-                return
-            
-            importe = float(importe_str)
-            # Validar que el importe sea mayor que 0
-            if importe <= 0:
-                self.error_view.mostrar_error(_("Amount must be greater than 0"))
-                return
-            
-            # Mostrar indicador de carga con el importe formateado
-            self.vista.mostrar_loading(_("Registering payment of {amount}...").format(
-                amount=format_currency(float(importe_str))
-            ))
-            
-            # Ejecutar el pago de forma asíncrona
-            self.concurrency_service.execute_async(
-                procesar_pago,
-                callback=on_success,
-                error_callback=on_error,
-                delay=self.delay_servidor
-            )
-        except ValueError:
-            # Error al convertir el importe a float (formato inválido)
+        # Validaciones previas en el hilo principal (sin delay)
+        # None significa que el texto no era un número (el campo vacío lo
+        # avisa la propia vista antes de llegar aquí)
+        if importe is None:
             self.error_view.mostrar_error(_("Amount must be a valid number"))
+            return
+
+        # Validar que el importe sea mayor que 0
+        if importe <= 0:
+            self.error_view.mostrar_error(_("Amount must be greater than 0"))
+            return
+
+        # Mostrar indicador de carga con el importe formateado
+        self.vista.mostrar_loading(_("Registering payment of {amount}...").format(
+            amount=format_currency(importe)
+        ))
+
+        # Ejecutar el pago de forma asíncrona
+        self.concurrency_service.execute_async(
+            procesar_pago,
+            callback=on_success,
+            error_callback=on_error,
+            delay=self.delay_servidor
+        )
     
     def borrar_todos_gastos(self):
         """
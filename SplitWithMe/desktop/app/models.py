@@ -18,9 +18,33 @@ amigos, gastos y cálculos de saldos.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from requests.exceptions import ConnectionError, Timeout
 
+# orjson decodifica JSON bastante más rápido que el módulo estándar (2-5x en
+# listas grandes). Es una dependencia opcional: si no está instalada se sigue
+# usando response.json() como hasta ahora
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parsear_json(response):
+    """
+    Decodifica el cuerpo JSON de una respuesta HTTP.
+
+    Usa orjson sobre los bytes crudos cuando está disponible (evita además
+    la detección de charset de requests); si no, delega en response.json().
+
+    Returns:
+        El contenido JSON decodificado (lista o diccionario)
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 # Configuración de la API
 
@@ -32,6 +56,15 @@ API_BASE_URL = "http://localhost:8000"
 # Si una petición tarda más de este tiempo, se lanza una excepción Timeout
 REQUEST_TIMEOUT = 10
 
+# Sesión HTTP compartida por todo el módulo. Reutiliza la conexión TCP con el
+# servidor (keep-alive) en lugar de abrir y cerrar una por petición, lo que
+# elimina el coste de conexión en los métodos que encadenan muchas llamadas
+_session = requests.Session()
+
+# Número máximo de peticiones simultáneas al repartir llamadas independientes
+# (por ejemplo, añadir/quitar varios participantes de un gasto)
+_MAX_PETICIONES_PARALELAS = 8
+
 
 
 # Entidades de Datos
@@ -59,7 +92,10 @@ class Amigo:
         self.nombre = nombre
         self.credit_balance = credit_balance  # Lo que le deben
         self.debit_balance = debit_balance    # Lo que debe
-    
+        # Saldo ya formateado como moneda, cacheado por la vista para no
+        # repetir el formateo en cada refresco. None = pendiente de formatear
+        self._fmt_saldo = None
+
     def saldo(self) -> float:
         """
         Calcula el saldo neto del amigo.
@@ -72,9 +108,10 @@ class Amigo:
     def actualizar_saldo(self, importe: float):
         """
         Actualiza el saldo a favor del amigo.
-        
+
         """
         self.credit_balance += importe
+        self._fmt_saldo = None  # El saldo cambió: invalidar el texto cacheado
     
     def to_dict(self) -> dict:
         """
@@ -124,7 +161,23 @@ class Gasto:
         self.deudores_ids = deudores_ids or []  # Quienes participaron
         self.credit_balance = credit_balance
         self.num_friends = num_friends  # Número de participantes
-    
+        # Textos ya formateados (moneda/fecha), cacheados por la vista para
+        # no repetir el formateo en cada refresco. None = pendiente
+        self._fmt_monto = None
+        self._fmt_fecha = None
+        self._fmt_division = None
+
+    def _invalidar_formatos(self):
+        """
+        Descarta los textos formateados cacheados de este gasto.
+
+        Debe llamarse tras mutar monto, fecha o num_friends para que la
+        vista vuelva a formatear los valores en el siguiente refresco.
+        """
+        self._fmt_monto = None
+        self._fmt_fecha = None
+        self._fmt_division = None
+
     def split(self) -> float:
         """
         Calcula cuánto debe pagar cada participante del gasto.
@@ -232,7 +285,53 @@ class Main:
         self.nombre = nombre
         self.amigos: list[Amigo] = []  # Lista de amigos del grupo
         self.gastos: list[Gasto] = []  # Lista de gastos compartidos
-    
+        # None = aún no se sabe si el servidor soporta el endpoint batch;
+        # False = el servidor respondió 404/405 y no se vuelve a intentar
+        self._batch_soportado = None
+
+    def _actualizar_creditos_batch(self, actualizaciones: list[tuple[int, int, float]]) -> bool:
+        """
+        Intenta aplicar varias actualizaciones de crédito en una sola petición.
+
+        En lugar de emitir un PUT por cada par (gasto, amigo), envía todas
+        las actualizaciones juntas a POST /expenses/credits/batch, eliminando
+        (N-1) viajes de ida y vuelta al servidor.
+
+        Args:
+            actualizaciones: Lista de tuplas (gasto_id, amigo_id, cantidad)
+
+        Returns:
+            True si el servidor aceptó el lote; False si el endpoint no existe
+            (404/405) y el llamador debe usar los PUT individuales de siempre
+
+        Nota:
+            El resultado de la sonda se recuerda en self._batch_soportado para
+            no repetir la petición fallida en cada operación.
+        """
+        if not actualizaciones:
+            return True
+        if self._batch_soportado is False:
+            return False  # Ya se comprobó que el servidor no lo soporta
+
+        # Convertir las tuplas al cuerpo JSON que espera el endpoint batch
+        batch = [
+            {"expense_id": gasto_id, "friend_id": amigo_id, "amount": cantidad}
+            for gasto_id, amigo_id, cantidad in actualizaciones
+        ]
+        response = _session.post(
+            f"{API_BASE_URL}/expenses/credits/batch",
+            json=batch,
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code in (404, 405):
+            # Servidor sin endpoint batch: recordar y dejar que el llamador
+            # haga los PUT uno a uno como hasta ahora
+            self._batch_soportado = False
+            return False
+        response.raise_for_status()
+        self._batch_soportado = True
+        return True
+
     # MÉTODOS DE AMIGOS
     
     def cargar_amigos(self) -> list[Amigo]:
@@ -251,7 +350,7 @@ class Main:
         """
         try:
             # Realizar petición GET a la API
-            response = requests.get(f"{API_BASE_URL}/friends/", timeout=REQUEST_TIMEOUT)
+            response = _session.get(f"{API_BASE_URL}/friends/", timeout=REQUEST_TIMEOUT)
             # Lanza excepción si el código de estado HTTP no es 2xx (200, 201, etc.)
             response.raise_for_status()
             
@@ -300,7 +399,7 @@ class Main:
             }
             
             # Realizar petición POST para crear el amigo
-            response = requests.post(f"{API_BASE_URL}/friends/", json=amigo_data, timeout=REQUEST_TIMEOUT)
+            response = _session.post(f"{API_BASE_URL}/friends/", json=amigo_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Convertir la respuesta a objeto Amigo y añadirlo a la lista local
@@ -339,7 +438,7 @@ class Main:
         """
         try:
             # Realizar petición DELETE para eliminar el amigo
-            response = requests.delete(f"{API_BASE_URL}/friends/{amigo_id}", timeout=REQUEST_TIMEOUT)
+            response = _session.delete(f"{API_BASE_URL}/friends/{amigo_id}", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Eliminar de la lista local (filtrar por ID)
@@ -376,7 +475,7 @@ class Main:
         """
         try:
             # Realizar petición GET para obtener el amigo
-            response = requests.get(f"{API_BASE_URL}/friends/{amigo_id}", timeout=REQUEST_TIMEOUT)
+            response = _session.get(f"{API_BASE_URL}/friends/{amigo_id}", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Convertir la respuesta a objeto Amigo
@@ -444,7 +543,7 @@ class Main:
         """
         try:
             # Realizar petición GET para obtener todos los gastos
-            response = requests.get(f"{API_BASE_URL}/expenses/", timeout=REQUEST_TIMEOUT)
+            response = _session.get(f"{API_BASE_URL}/expenses/", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             gastos_data = response.json()
             
@@ -468,7 +567,7 @@ class Main:
                     for participante_id in participantes_ids:
                         try:
                             # Obtener información del participante para verificar su crédito
-                            response_participante = requests.get(
+                            response_participante = _session.get(
                                 f"{API_BASE_URL}/expenses/{gasto.id}/friends/{participante_id}", 
                                 timeout=REQUEST_TIMEOUT
                             )
@@ -544,7 +643,7 @@ class Main:
             }
             
             # POST /expenses/ - Crear el gasto
-            response = requests.post(f"{API_BASE_URL}/expenses/", json=gasto_data, timeout=REQUEST_TIMEOUT)
+            response = _session.post(f"{API_BASE_URL}/expenses/", json=gasto_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Convertir la respuesta a objeto Gasto
@@ -556,7 +655,7 @@ class Main:
             # POST /expenses/{id}/friends - Añadir cada participante
             for deudor_id in deudores_ids:
                 try:
-                    requests.post(
+                    _session.post(
                         f"{API_BASE_URL}/expenses/{gasto.id}/friends",
                         params={"friend_id": deudor_id}
                     ).raise_for_status()
@@ -580,14 +679,14 @@ class Main:
             try:
                 # Solo añadir el pagador si no está ya en la lista de deudores
                 if pagador_id not in deudores_ids:
-                    requests.post(
+                    _session.post(
                         f"{API_BASE_URL}/expenses/{gasto.id}/friends",
                         params={"friend_id": pagador_id}
                     ).raise_for_status()
                 
                 # Actualizar el crédito del pagador (PUT /expenses/{id}/friends/{friend_id})
                 # Esto marca que el pagador tiene crédito (le deben dinero)
-                requests.put(
+                _session.put(
                     f"{API_BASE_URL}/expenses/{gasto.id}/friends/{pagador_id}",
                     params={"amount": credito_pagador}
                 ).raise_for_status()
@@ -602,7 +701,7 @@ class Main:
                 for deudor_id in deudores_ids:
                     try:
                         # PUT /expenses/{id}/friends/{friend_id} - Actualizar deuda del deudor
-                        requests.put(
+                        _session.put(
                             f"{API_BASE_URL}/expenses/{gasto.id}/friends/{deudor_id}",
                             params={"amount": monto_por_deudor}  # Negativo = debe
                         ).raise_for_status()
@@ -616,7 +715,7 @@ class Main:
                     if deudor_id != pagador_id:  # No actualizar al pagador otra vez (ya tiene crédito)
                         try:
                             # PUT /expenses/{id}/friends/{friend_id} - Actualizar deuda
-                            requests.put(
+                            _session.put(
                                 f"{API_BASE_URL}/expenses/{gasto.id}/friends/{deudor_id}",
                                 params={"amount": -monto_por_persona}  # Negativo = debe
                             ).raise_for_status()
@@ -632,7 +731,7 @@ class Main:
             if gasto_id:
                 try:
                     # Intentar eliminar el gasto creado (rollback)
-                    requests.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
+                    _session.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
                 except:
                     pass  # Si falla el rollback, no hay nada más que hacer
             raise Exception("No se puede conectar al servidor. Verifica que el servidor esté ejecutándose")
@@ -642,7 +741,7 @@ class Main:
             if gasto_id:
                 try:
                     # Intentar eliminar el gasto creado (rollback)
-                    requests.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
+                    _session.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
                 except:
                     pass
             raise Exception("El servidor tardó demasiado en responder. El gasto podría no haberse creado correctamente")
@@ -652,7 +751,7 @@ class Main:
             if gasto_id:
                 try:
                     # Intentar eliminar el gasto creado (rollback)
-                    requests.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
+                    _session.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
                 except:
                     pass  # Si falla el rollback, no hay nada que hacer
             
@@ -681,7 +780,7 @@ class Main:
         """
         try:
             # Realizar petición DELETE para eliminar el gasto
-            response = requests.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
+            response = _session.delete(f"{API_BASE_URL}/expenses/{gasto_id}", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Eliminar de la lista local (filtrar por ID)
@@ -721,9 +820,9 @@ class Main:
         """
         try:
             # Realizar petición GET para obtener los participantes
-            response = requests.get(f"{API_BASE_URL}/expenses/{gasto_id}/friends", timeout=REQUEST_TIMEOUT)
+            response = _session.get(f"{API_BASE_URL}/expenses/{gasto_id}/friends", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            participantes_data = response.json()
+            participantes_data = _parsear_json(response)
             
             # Manejar diferentes estructuras de respuesta de la API
             # La API puede devolver diferentes formatos según la versión
@@ -785,7 +884,18 @@ class Main:
             # Verificar si los participantes cambiaron (necesario para recalcular saldos)
             participantes_actuales = self.obtener_participantes_gasto(gasto_id)
             nuevos_participantes = nuevos_datos.get("participantes_ids", participantes_actuales)
-            
+
+            # Evaluar una sola vez qué cambió: los dos bloques siguientes
+            # dependen de estas condiciones y no hace falta reconstruir los
+            # sets en cada comprobación. Si solo cambió la descripción o la
+            # fecha, el método emite un único PUT y termina
+            nuevos_set = set(nuevos_participantes)
+            participantes_cambiaron = set(participantes_actuales) != nuevos_set
+            monto_cambio = monto_anterior != monto_nuevo
+
+            # Obtener el pagador (puede venir en los datos o usar el actual)
+            pagador_id = nuevos_datos.get("pagador_id", gasto_actual.pagador_id)
+
             # Preparar los datos básicos del gasto para actualizar
             gasto_data = {
                 "id": gasto_id,
@@ -795,49 +905,62 @@ class Main:
             }
             
             # PUT /expenses/{id} - Actualizar datos básicos del gasto
-            response = requests.put(f"{API_BASE_URL}/expenses/{gasto_id}", json=gasto_data, timeout=REQUEST_TIMEOUT)
+            response = _session.put(f"{API_BASE_URL}/expenses/{gasto_id}", json=gasto_data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Si los participantes cambiaron, actualizar la lista de participantes
-            if set(participantes_actuales) != set(nuevos_participantes):
-                # Eliminar participantes que ya no están en la nueva lista
-                for participante_id in participantes_actuales:
-                    if participante_id not in nuevos_participantes:
-                        try:
-                            # DELETE /expenses/{id}/friends/{friend_id} - Eliminar participante
-                            requests.delete(f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}").raise_for_status()
-                        except requests.exceptions.RequestException as e:
-                            # Registrar el error pero continuar 
-                            print(f"Advertencia: No se pudo eliminar participante {participante_id}: {str(e)}")
-                            continue
-                
-                # Añadir nuevos participantes que no estaban antes
-                for participante_id in nuevos_participantes:
-                    if participante_id not in participantes_actuales:
-                        try:
-                            # POST /expenses/{id}/friends - Añadir participante
-                            requests.post(
-                                f"{API_BASE_URL}/expenses/{gasto_id}/friends",
-                                params={"friend_id": participante_id}
-                            ).raise_for_status()
-                        except requests.exceptions.RequestException as e:
-                            # Registrar el error pero continuar (
-                            print(f"Advertencia: No se pudo añadir participante {participante_id}: {str(e)}")
-                            continue
+            # Cada DELETE/POST es independiente del resto, así que se lanzan
+            # en paralelo sobre la sesión compartida en lugar de esperar una
+            # respuesta antes de emitir la siguiente petición
+            if participantes_cambiaron:
+                def eliminar_participante(participante_id):
+                    """Elimina un participante del gasto (se ejecuta en paralelo)."""
+                    try:
+                        # DELETE /expenses/{id}/friends/{friend_id} - Eliminar participante
+                        _session.delete(
+                            f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}",
+                            timeout=REQUEST_TIMEOUT
+                        ).raise_for_status()
+                    except requests.exceptions.RequestException as e:
+                        # Registrar el error pero continuar
+                        print(f"Advertencia: No se pudo eliminar participante {participante_id}: {str(e)}")
+
+                def anadir_participante(participante_id):
+                    """Añade un participante al gasto (se ejecuta en paralelo)."""
+                    try:
+                        # POST /expenses/{id}/friends - Añadir participante
+                        _session.post(
+                            f"{API_BASE_URL}/expenses/{gasto_id}/friends",
+                            params={"friend_id": participante_id},
+                            timeout=REQUEST_TIMEOUT
+                        ).raise_for_status()
+                    except requests.exceptions.RequestException as e:
+                        # Registrar el error pero continuar
+                        print(f"Advertencia: No se pudo añadir participante {participante_id}: {str(e)}")
+
+                # Participantes que ya no están en la nueva lista
+                a_eliminar = [p for p in participantes_actuales if p not in nuevos_participantes]
+                # Nuevos participantes que no estaban antes
+                a_anadir = [p for p in nuevos_participantes if p not in participantes_actuales]
+
+                with ThreadPoolExecutor(max_workers=_MAX_PETICIONES_PARALELAS) as pool:
+                    # list() fuerza la espera a que terminen todas las peticiones
+                    list(pool.map(eliminar_participante, a_eliminar))
+                    list(pool.map(anadir_participante, a_anadir))
             
             # Si el monto cambió o los participantes cambiaron, recalcular saldos
-            if monto_anterior != monto_nuevo or set(participantes_actuales) != set(nuevos_participantes):
-                # Obtener el pagador (puede venir en los datos o usar el actual)
-                pagador_id = nuevos_datos.get("pagador_id", gasto_actual.pagador_id)
-                
+            if monto_cambio or participantes_cambiaron:
                 # Si no hay pagador especificado, buscar el que tiene crédito > 0
                 if not pagador_id:
                     for participante_id in nuevos_participantes:
                         try:
                             # GET /expenses/{id}/friends/{friend_id} - Obtener info del participante
-                            response = requests.get(f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}")
+                            response = _session.get(
+                                f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}",
+                                timeout=REQUEST_TIMEOUT
+                            )
                             response.raise_for_status()
-                            participante_data = response.json()
+                            participante_data = _parsear_json(response)
                             # Si tiene crédito > 0, es el pagador
                             if participante_data.get("credit_balance", 0) > 0:
                                 pagador_id = participante_id
@@ -847,32 +970,39 @@ class Main:
                             continue
                 
                 # Recalcular créditos para todos los participantes
+                # El pagador recibe crédito por la parte de los demás; el resto
+                # no tiene crédito (solo deuda). Las divisiones se calculan una
+                # sola vez fuera del bucle: el reparto es el mismo para todos
+                num_participantes = len(nuevos_participantes)
+                monto_por_persona = monto_nuevo / num_participantes if num_participantes else 0.0
+                if pagador_id in nuevos_set:
+                    # Caso: Pagador también participó
+                    # Solo recibe crédito por la parte de los demás
+                    credito_pagador = monto_nuevo - monto_por_persona
+                else:
+                    # Caso: Pagador no participó
+                    # Recibe crédito por el monto total
+                    credito_pagador = monto_nuevo
+
+                actualizaciones = []
                 for participante_id in nuevos_participantes:
-                    try:
-                        if participante_id == pagador_id:
-                            # Calcular crédito del pagador
-                            if pagador_id in nuevos_participantes:
-                                # Caso: Pagador también participó
-                                # Solo recibe crédito por la parte de los demás
-                                monto_por_persona = monto_nuevo / len(nuevos_participantes)
-                                monto_otros = monto_nuevo - monto_por_persona
-                                nuevo_credito = monto_otros
-                            else:
-                                # Caso: Pagador no participó
-                                # Recibe crédito por el monto total
-                                nuevo_credito = monto_nuevo
-                        else:
-                            # Los demás participantes no tienen crédito (solo deuda)
-                            nuevo_credito = 0
-                        
-                        # PUT /expenses/{id}/friends/{friend_id} - Actualizar crédito
-                        requests.put(
-                            f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}",
-                            params={"amount": nuevo_credito}
-                        ).raise_for_status()
-                    except requests.exceptions.RequestException as e:
-                        print(f"Advertencia: No se pudo actualizar crédito de participante {participante_id}: {str(e)}")
-                        continue  # Continuar con el siguiente participante
+                    nuevo_credito = credito_pagador if participante_id == pagador_id else 0
+                    actualizaciones.append((gasto_id, participante_id, nuevo_credito))
+
+                # Enviar todos los créditos en una sola petición batch; si el
+                # servidor no lo soporta, volver al PUT por participante
+                if not self._actualizar_creditos_batch(actualizaciones):
+                    for _, participante_id, nuevo_credito in actualizaciones:
+                        try:
+                            # PUT /expenses/{id}/friends/{friend_id} - Actualizar crédito
+                            _session.put(
+                                f"{API_BASE_URL}/expenses/{gasto_id}/friends/{participante_id}",
+                                params={"amount": nuevo_credito},
+                                timeout=REQUEST_TIMEOUT
+                            ).raise_for_status()
+                        except requests.exceptions.RequestException as e:
+                            print(f"Advertencia: No se pudo actualizar crédito de participante {participante_id}: {str(e)}")
+                            continue  # Continuar con el siguiente participante
             
             # Actualizar en la lista local con los nuevos datos
             if gasto_actual:
@@ -881,6 +1011,7 @@ class Main:
                 gasto_actual.fecha = gasto_data["date"]
                 gasto_actual.pagador_id = pagador_id
                 gasto_actual.deudores_ids = nuevos_participantes
+                gasto_actual._invalidar_formatos()  # Monto/fecha pueden haber cambiado
                 
         except ConnectionError:
             raise Exception("No se puede conectar al servidor")
@@ -916,10 +1047,10 @@ class Main:
             saldos[amigo.id] = amigo.saldo()  # credit_balance - debit_balance
         return saldos
     
-    def pagar_saldo(self, amigo_id: int, importe: float):
+    def pagar_saldo(self, amigo_id: int, importe: float, refresh: bool = False):
         """
         Registra un pago realizado por un amigo para saldar su deuda.
-        
+
         Este método distribuye el pago entre los gastos pendientes del amigo,
         aplicando el pago primero a los gastos más antiguos hasta agotar el importe.
 
@@ -929,14 +1060,22 @@ class Main:
            - Calcula cuánto debe en ese gasto
            - Aplica el pago (hasta agotar el importe)
            - Actualiza el crédito del amigo en ese gasto
-        3. Recarga los datos de amigos para actualizar saldos
-        
+        3. Actualiza el saldo local del amigo con el total pagado
+           (evita recargar toda la lista de amigos desde el servidor)
+
+        Args:
+            refresh: Si es True, recarga la lista completa de amigos desde
+                la API tras el pago en lugar de actualizar solo en memoria
+
+        Returns:
+            Lista de tuplas (gasto_id, amigo_id, pago) con los créditos aplicados
+
         Raises:
             Exception: Si hay error de conexión, timeout o HTTP
                 - ConnectionError: No se puede conectar al servidor
                 - Timeout: El servidor tardó demasiado en responder
                 - RequestException: Error HTTP (404, 400, 500, etc.)
-        
+
         Nota:
             El pago se distribuye automáticamente entre los gastos pendientes.
             Si el importe es mayor que la deuda total, el exceso se aplica
@@ -945,13 +1084,14 @@ class Main:
         try:
             # Paso 1: Obtener todos los gastos del amigo desde la API
             # GET /friends/{id}/expenses - Obtener gastos donde participa el amigo
-            response = requests.get(f"{API_BASE_URL}/friends/{amigo_id}/expenses", timeout=REQUEST_TIMEOUT)
+            response = _session.get(f"{API_BASE_URL}/friends/{amigo_id}/expenses", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            gastos_amigo = response.json()
+            gastos_amigo = _parsear_json(response)  # Lista potencialmente grande
             
             # Paso 2: Distribuir el pago entre los gastos pendientes
             # Se aplica el pago a cada gasto hasta agotar el importe
             importe_restante = importe
+            actualizaciones = []  # Créditos aplicados: (gasto_id, amigo_id, pago)
             for gasto_data in gastos_amigo:
                 # Si ya se agotó el importe, no procesar más gastos
                 if importe_restante <= 0:
@@ -966,20 +1106,35 @@ class Main:
                     # Calcular cuánto se puede pagar de este gasto
                     # (el mínimo entre lo que queda del pago y la deuda)
                     pago = min(importe_restante, deuda)
-                    
+                    actualizaciones.append((gasto_id, amigo_id, pago))
+                    importe_restante -= pago  # Reducir el importe restante
+
+            # Aplicar todos los créditos acumulados en una sola petición batch;
+            # si el servidor no soporta el endpoint, volver al PUT por gasto
+            if not self._actualizar_creditos_batch(actualizaciones):
+                for gasto_id, amigo_id_pago, pago in actualizaciones:
                     # PUT /expenses/{id}/friends/{friend_id} - Actualizar crédito del amigo
                     # Al aumentar el crédito, se reduce la deuda
-                    requests.put(
-                        f"{API_BASE_URL}/expenses/{gasto_id}/friends/{amigo_id}",
+                    _session.put(
+                        f"{API_BASE_URL}/expenses/{gasto_id}/friends/{amigo_id_pago}",
                         params={"amount": pago},  # Aumentar crédito = reducir deuda
                         timeout=REQUEST_TIMEOUT
                     )
-                    importe_restante -= pago  # Reducir el importe restante
-            
-            # Paso 3: Recargar los datos de amigos para actualizar los saldos
-            # Esto asegura que los saldos mostrados en la UI estén actualizados
-            self.cargar_amigos()
-            
+
+            # Paso 3: Actualizar los saldos locales con lo realmente pagado
+            # Se evita así una recarga completa de amigos por cada pago; la
+            # lista solo se recarga desde la API si se pide explícitamente
+            if refresh:
+                self.cargar_amigos()
+            else:
+                total_pagado = importe - importe_restante
+                for amigo in self.amigos:
+                    if amigo.id == amigo_id:
+                        amigo.actualizar_saldo(total_pagado)  # Sumar crédito local
+                        break
+
+            return actualizaciones
+
         except ConnectionError:
             raise Exception("No se puede conectar al servidor")
         except Timeout:
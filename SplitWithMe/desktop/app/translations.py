@@ -8,15 +8,20 @@ Este módulo proporciona funcionalidades para:
 - Formatear fechas según las convenciones locales
 - Obtener símbolos de moneda apropiados
 
-Utiliza la biblioteca estándar de Python `gettext` para la gestión de traducciones
-y `locale` para el formateo de números y monedas según las convenciones regionales.
+Utiliza la biblioteca estándar de Python `gettext` para la gestión de
+traducciones; el formateo de números, monedas y fechas se hace con cadenas
+según el idioma activo, sin tocar el locale del proceso.
 """
 
 import gettext
-import locale
 import os
 from pathlib import Path
 
+# Directorio donde se almacenan los archivos de traducción (.po/.mo).
+# Se resuelve una única vez al importar el módulo: la ruta no cambia durante
+# la ejecución, así que no hace falta recomputarla en cada cambio de idioma
+_LOCALE_DIR = str(Path(__file__).resolve().parent.parent / 'locales')
+
 class TranslationManager:
     """
     Gestor de traducciones para la aplicación.
@@ -24,26 +29,29 @@ class TranslationManager:
     Esta clase maneja la carga y gestión de traducciones utilizando gettext,
     permitiendo cambiar dinámicamente el idioma de la aplicación.
     """
-    
+
+    # Caché de objetos de traducción ya cargados, indexados por código de
+    # idioma. Cargar un translator implica leer y parsear el archivo .mo
+    # binario; al cachearlo, volver a un idioma ya visitado es una simple
+    # búsqueda en el diccionario
+    _translator_cache: dict[str, gettext.NullTranslations] = {}
+
     def __init__(self):
         """Inicializa el gestor de traducciones con inglés como idioma por defecto."""
         self.current_language = 'en'  # Idioma por defecto: inglés
         self.current_locale = 'en_US.UTF-8'  # Locale por defecto: inglés (EE.UU)
         self.translator = None  # Objeto translator de gettext (se inicializa en _setup_translations)
+        self._currency_symbol = '$'  # Símbolo de moneda del idioma por defecto
         self._setup_translations()
     
     def _setup_translations(self):
         """
         Configura inicialmente las traducciones.
         
-        Busca el directorio 'locales' en la raíz del proyecto y configura
-        un translator nulo (sin traducciones) como punto de partida.
+        Configura un translator nulo (sin traducciones) como punto de partida.
         Si las traducciones no están disponibles, el sistema funcionará
         mostrando los mensajes en su idioma original.
         """
-        base_dir = Path(__file__).parent.parent  # Directorio raíz del proyecto
-        locale_dir = base_dir / 'locales'  # Directorio donde se almacenan los archivos .po/.mo
-        
         # NullTranslations devuelve el mensaje original sin traducir
         self.translator = gettext.NullTranslations()
         
@@ -74,19 +82,28 @@ class TranslationManager:
                 self.current_locale = 'en_US.UTF-8'  # Inglés de Estados Unidos por defecto
 
         self.current_language = language_code
-        
-        # Obtener ruta al directorio de traducciones
-        base_dir = Path(__file__).parent.parent
-        locale_dir = base_dir / 'locales'
-        
+
+        # Recalcular el símbolo de moneda una sola vez por cambio de idioma;
+        # get_currency_symbol() lo consulta constantemente desde la interfaz
+        self._currency_symbol = '€' if language_code in ('es', 'pt') else '$'
+
+        # Reutilizar el translator si este idioma ya se cargó antes
+        # (evita re-leer y re-parsear el archivo .mo en cada cambio)
+        translator = self._translator_cache.get(language_code)
+        if translator is not None:
+            self.translator = translator
+            return
+
         # Intentar cargar las traducciones desde los archivos .mo
         try:
             self.translator = gettext.translation(
                 'messages',  # Dominio de traducción (nombre base de los archivos .po/.mo)
-                localedir=str(locale_dir),  # Directorio donde buscar las traducciones
+                localedir=_LOCALE_DIR,  # Directorio donde buscar las traducciones
                 languages=[language_code],  # Lista de idiomas a cargar
                 fallback=True  # Si no encuentra el idioma, usar NullTranslations
             )
+            # Guardar en la caché para futuros cambios a este mismo idioma
+            self._translator_cache[language_code] = self.translator
         except Exception as e:
             # Si no encuentra el idioma, se usa el inglés por defecto (NullTranslations)
             print(f"Warning: Could not load translations for {language_code}: {e}")
@@ -145,7 +162,11 @@ def get_current_language() -> str:
 def get_locale() -> str:
     """
     Función de conveniencia para obtener el locale actual.
-    
+
+    El formateo interno ya no depende del locale del proceso, pero el
+    locale configurado se conserva como parte de la API pública del
+    módulo para los llamadores que lo necesiten.
+
     Returns:
         Locale completo configurado
     """
@@ -173,48 +194,31 @@ def _(message: str) -> str:
 def format_currency(amount: float) -> str:
     """
     Formatea un valor numérico como moneda según el idioma actual.
-    
-    Intenta usar el locale del sistema para un formateo preciso.
-    Si falla, usa un formateo manual basado en el idioma:
-    - Español/Portugués: formato europeo con euro (€)
-    - Inglés: formato americano con dólar ($)
-    
+
+    El formateo se hace con cadenas, sin tocar el locale del proceso:
+    `locale.setlocale` es global y no es seguro entre hilos, por lo que
+    cambiarlo temporalmente aquí podía corromper el formateo de fechas o
+    números en los hilos de fondo que usan la aplicación.
+
+    Formatos generados:
+    - Español/Portugués: formato europeo con euro (ej: "1.234,56 €")
+    - Inglés (y otros): formato americano con dólar (ej: "$1,234.56")
+
     Returns:
         String con la moneda formateada (ej: "1.234,56 €", "$1,234.56")
-    
-    Nota:
-        El locale se configura temporalmente y se restaura al valor anterior
-        para no afectar otras partes de la aplicación.
     """
-    try:
-        # Establecer el locale para formateo numérico y monetario
-        current_locale = translation_manager.get_locale()
-        
-        # Guardar el locale actual para restaurarlo después
-        # Se configura el locale temporalmente para formatear la moneda según el idioma seleccionado
-        old_locale = locale.setlocale(locale.LC_MONETARY, None)
-        try:
-            # Configurar el locale para formateo monetario
-            locale.setlocale(locale.LC_MONETARY, current_locale)
-            
-            # Formatear la moneda con separadores de miles (grouping=True)
-            formatted = locale.currency(amount, grouping=True)
-            return formatted
-        finally:
-            # Restaurar locale anterior para no afectar otras partes de la aplicación
-            locale.setlocale(locale.LC_MONETARY, old_locale)
-    except Exception as e:
-        # Fallback: formato manual por idioma si falla la configuración del locale
-        lang = translation_manager.current_language
-        if lang == 'pt':
-            # Portugués: coma como separador decimal, punto para miles, símbolo €
-            return f"{amount:.2f} €".replace('.', ',')
-        elif lang == 'es':
-            # Español: formato similar, símbolo €
-            return f"{amount:.2f} €"
-        else:
-            # Inglés (y otros): formato americano, símbolo $
-            return f"${amount:.2f}"
+    lang = translation_manager.current_language
+    if lang in ('es', 'pt'):
+        # Formato europeo: punto para los miles, coma decimal, símbolo € detrás
+        # Python formatea "1,234.56"; se intercambian los separadores
+        texto = f"{amount:,.2f}"
+        texto = texto.replace(',', '\x00').replace('.', ',').replace('\x00', '.')
+        return f"{texto} €"
+    # Formato americano: coma para los miles, punto decimal, símbolo $ delante
+    if amount < 0:
+        # El signo va delante del símbolo: "-$12.34"
+        return f"-${-amount:,.2f}"
+    return f"${amount:,.2f}"
 
 def format_date(date_str: str) -> str:
     """
@@ -261,8 +265,5 @@ def get_currency_symbol() -> str:
         get_currency_symbol() -> "€" (si idioma es es o pt)
         get_currency_symbol() -> "$" (si idioma es en u otro)
     """
-    lang = translation_manager.current_language
-    if lang in ['es', 'pt']:
-        return '€'  # Euro para español y portugués
-    else:
-        return '$'  # Dólar para inglés y otros idiomas
+    # El símbolo se calcula en set_language; aquí solo se lee el atributo
+    return translation_manager._currency_symbol
@@ -13,11 +13,158 @@ Responsabilidades de la vista:
 - Gestionar diálogos para agregar/editar/eliminar elementos
 """
 
+import os
+import types
+import weakref
+
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib, Pango
 from translations import _, format_currency, format_date
 
+# Gtk.Inscription (GTK 4.8+) es una alternativa ligera a Gtk.Label para texto
+# de una sola línea: no recalcula su tamaño con Pango en cada pase de layout,
+# lo que ahorra trabajo en listas con muchas filas
+_HAS_INSCRIPTION = hasattr(Gtk, 'Inscription')
+
+# Sondas de capacidades de la versión de GTK instalada, evaluadas una sola
+# vez al importar. Evitan envolver cada llamada en try/except (montar una
+# excepción en CPython tiene coste real y el resultado es fijo por versión)
+_HAS_SHRINK = hasattr(Gtk.Paned, 'set_shrink_start_child')
+_HAS_MAXIMIZE = hasattr(Gtk.Window, 'maximize')
+
+# Número de filas que se añaden por tick del bucle principal cuando una
+# lista se puebla desde cero (ver _poblar_listbox_en_chunks)
+_FILAS_POR_TICK = 20
+
+# Atributos Pango precalculados para los textos en negrita de las filas.
+# Aplicar un AttrList evita parsear el markup "<b>...</b>" en cada creación
+# y refresco de label, y no inyecta los nombres del usuario en el parser
+_BOLD_ATTRS = Pango.AttrList()
+_BOLD_ATTRS.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+
+# Caché de cadenas traducidas de los caminos calientes (se consultan en cada
+# refresco de cada fila). Se rellena de forma perezosa en el primer uso, que
+# ocurre después de que main configure el idioma con set_language(); si se
+# tradujeran al importar el módulo, quedarían cacheadas sin traducir
+_STRINGS = None
+
+
+def _strings():
+    """
+    Devuelve la caché de cadenas traducidas, creándola en el primer uso.
+
+    Cada llamada a _() es una búsqueda en el catálogo de gettext. Las filas
+    de las listas usan siempre las mismas plantillas, así que se traducen
+    una sola vez y los refrescos posteriores hacen solo una búsqueda en el
+    diccionario. Las plantillas con {amount}/{name} se cachean sin formatear;
+    el .format() sigue siendo por fila.
+    """
+    global _STRINGS
+    if _STRINGS is None:
+        _STRINGS = {
+            'balance': _("Balance: {amount}"),
+            'per_person': _("Per person: {amount} ({count} people)"),
+            'paid_by': _("Paid by: {name}"),
+            'unknown': _("Unknown"),
+            # Cadenas de las aperturas de diálogo y del indicador de carga:
+            # no son por fila, pero sí por interacción, y usan las mismas
+            # plantillas siempre
+            'add_expense': _("Add expense"),
+            'edit_expense': _("Edit expense"),
+            'add': _("Add"),
+            'save': _("Save"),
+            'participants': _("Participants:"),
+            'who_participated': _("Who participated?"),
+            'loading': _("Loading..."),
+            'pay_title': _("Pay balance of {name}"),
+        }
+    return _STRINGS
+
+
+def _crear_texto_fila(texto: str):
+    """
+    Crea el widget de texto para una línea secundaria de una fila.
+
+    Usa Gtk.Inscription cuando está disponible (más barato de medir en cada
+    pase de layout); en versiones de GTK anteriores a 4.8 usa Gtk.Label.
+
+    Retorna: Widget con el texto alineado a la izquierda
+    """
+    if _HAS_INSCRIPTION:
+        # min_chars/nat_chars fijan el tamaño pedido sin medir el texto real
+        return Gtk.Inscription(text=texto, xalign=0, min_chars=20, nat_chars=40)
+    return Gtk.Label(label=texto, xalign=0)
+
+
+def _crear_handler_boton(nombre: str, cb_attr: str, sel_attr: str = None):
+    """
+    Fabrica un handler de click de botón a partir de su descripción.
+
+    Todos los handlers de botón "simples" comparten la misma forma: leer
+    el callback del controlador, opcionalmente leer la selección cacheada,
+    y llamar. En lugar de repetir ese cuerpo en un método por botón, la
+    vista los genera desde una tabla declarativa (ver _BTN_HANDLERS) con
+    esta única función: un solo cuerpo compartido en vez de uno por botón.
+
+    nombre: Nombre del botón (para el __name__ del handler generado)
+    cb_attr: Atributo de la vista con el callback del controlador
+    sel_attr: Atributo con la selección cacheada a pasar como argumento,
+              o None si el callback no recibe argumentos
+    """
+    def handler(self, button):
+        cb = getattr(self, cb_attr)
+        if not cb:
+            return
+        if sel_attr is None:
+            cb()
+            return
+        seleccion = getattr(self, sel_attr)
+        if seleccion is not None:
+            cb(seleccion)
+
+    handler.__name__ = f'_on_btn_{nombre}_clicked'
+    handler.__qualname__ = f'PantallaInicialView.{handler.__name__}'
+    return handler
+
+
+class _WeakCallback:
+    """
+    Descriptor para los callbacks que el controlador asigna a la vista.
+
+    El controlador guarda una referencia fuerte a la vista y la vista
+    guardaba sus métodos ligados: un ciclo que el recolector cíclico de
+    CPython tiene que recorrer en cada pasada. Este descriptor almacena
+    los métodos ligados como weakref.WeakMethod, rompiendo el ciclo; al
+    leer el atributo se desreferencia y se devuelve el callable real (o
+    None si el controlador ya no existe), así que los handlers siguen
+    usando el patrón "cb = self.on_X_callback; if cb: cb(...)" sin cambios.
+
+    Los callables que no son métodos ligados (funciones sueltas, None) se
+    guardan tal cual: una referencia débil a una lambda sin más dueños
+    moriría en el acto.
+    """
+
+    __slots__ = ('nombre',)
+
+    def __set_name__(self, owner, name):
+        # Nombre con el que se guarda el valor real en el __dict__ de la
+        # instancia (el descriptor vive en la clase)
+        self.nombre = '_weak_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        valor = obj.__dict__.get(self.nombre)
+        if type(valor) is weakref.WeakMethod:
+            return valor()  # Método real, o None si el dueño murió
+        return valor
+
+    def __set__(self, obj, valor):
+        if isinstance(valor, types.MethodType):
+            valor = weakref.WeakMethod(valor)
+        obj.__dict__[self.nombre] = valor
+
 
 class ErrorView:
     """
@@ -27,7 +174,12 @@ class ErrorView:
     que informan al usuario sobre errores o información importante.
     Utiliza Gtk.MessageDialog para crear diálogos estándar de GTK.
     """
-    
+
+    # Sin __dict__ por instancia: los atributos son descriptores de slot,
+    # con acceso más rápido y menos memoria. (Solo es posible aquí porque
+    # ErrorView es una clase Python normal, no un subtipo de GObject)
+    __slots__ = ('parent_window', '_error_dialog', '_info_dialog')
+
     def __init__(self, parent_window):
         """
         Inicializa la vista de errores.
@@ -35,46 +187,176 @@ class ErrorView:
         parent_window: Ventana padre que será la propietaria de los diálogos
         """
         self.parent_window = parent_window  # Ventana padre para los diálogos
+        # Diálogos cacheados: se construyen en el primer uso y se reutilizan
+        # en llamadas posteriores cambiando solo el texto del mensaje
+        self._error_dialog = None
+        self._info_dialog = None
 
-    def mostrar_error(self, mensaje: str):
+    @staticmethod
+    def _ocultar_on_response(dialog, response_id):
         """
-        Muestra un diálogo de error con un mensaje.
-        
-        Crea un diálogo modal de tipo ERROR con un botón OK.
-        El mensaje se muestra como texto secundario del diálogo.
-        El diálogo se cierra automáticamente cuando el usuario hace clic en OK.
+        Handler compartido que oculta un diálogo al responder.
+
+        Al ser un método estático, todas las conexiones de señal comparten
+        el mismo objeto función en lugar de asignar una lambda por diálogo.
+        """
+        dialog.hide()
+
+    def _crear_dialogo(self, message_type, titulo):
+        """
+        Construye un MessageDialog reutilizable del tipo indicado.
+
+        El evento de respuesta se conecta una sola vez y oculta el diálogo
+        en lugar de cerrarlo, para que el widget sobreviva y pueda volver
+        a presentarse con otro mensaje.
+
+        Retorna: El Gtk.MessageDialog construido
         """
         dialog = Gtk.MessageDialog(
             transient_for=self.parent_window,  # Ventana padre (el diálogo aparece encima)
             modal=True,                        # Bloquea la interacción con otras ventanas
-            message_type=Gtk.MessageType.ERROR,  # Tipo de diálogo: ERROR (icono de error)
-            buttons=Gtk.ButtonsType.OK,       # Botones: solo OK
-            text=_("An error occurred")       # Título del diálogo (traducido)
+            message_type=message_type,         # Tipo de diálogo (icono de error o info)
+            buttons=Gtk.ButtonsType.OK,        # Botones: solo OK
+            text=titulo                        # Título del diálogo (traducido)
         )
-        dialog.props.secondary_text = mensaje  # Mensaje principal (texto secundario)
-        # Conectar el evento de respuesta para cerrar el diálogo cuando se hace clic
-        dialog.connect("response", lambda d, r: d.close())
-        dialog.present()  # Mostrar el diálogo
-    
+        # Ocultar (no destruir) el diálogo cuando el usuario responde.
+        # hide-on-close cubre además Esc y el cierre del gestor de
+        # ventanas, cuya acción por defecto destruiría el widget cacheado
+        dialog.set_hide_on_close(True)
+        dialog.connect("response", self._ocultar_on_response)
+        return dialog
+
+    def mostrar_error(self, mensaje: str):
+        """
+        Muestra un diálogo de error con un mensaje.
+
+        Reutiliza un diálogo modal de tipo ERROR con un botón OK,
+        creándolo en la primera llamada. El mensaje se muestra como
+        texto secundario del diálogo.
+        """
+        if self._error_dialog is None:
+            self._error_dialog = self._crear_dialogo(Gtk.MessageType.ERROR, _("An error occurred"))
+        self._error_dialog.props.secondary_text = mensaje  # Mensaje principal (texto secundario)
+        self._error_dialog.present()  # Mostrar el diálogo
+
     def mostrar_info(self, mensaje: str):
         """
         Muestra un diálogo informativo con un mensaje.
-        
-        Crea un diálogo modal de tipo INFO con un botón OK.
+
         Similar a mostrar_error pero con icono informativo en lugar de error.
         Útil para mostrar mensajes de éxito o información.
         """
-        dialog = Gtk.MessageDialog(
-            transient_for=self.parent_window,  # Ventana padre
-            modal=True,                        # Modal: bloquea otras ventanas
-            message_type=Gtk.MessageType.INFO,  # Tipo: INFO (icono informativo)
-            buttons=Gtk.ButtonsType.OK,       # Solo botón OK
-            text=_("Information")             # Título traducido
-        )
-        dialog.props.secondary_text = mensaje  # Mensaje principal
-        # Cerrar el diálogo cuando el usuario responde
-        dialog.connect("response", lambda d, r: d.close())
-        dialog.present()  # Mostrar el diálogo
+        if self._info_dialog is None:
+            self._info_dialog = self._crear_dialogo(Gtk.MessageType.INFO, _("Information"))
+        self._info_dialog.props.secondary_text = mensaje  # Mensaje principal
+        self._info_dialog.present()  # Mostrar el diálogo
+
+
+# Definición XML del diálogo de pagar saldo. GtkBuilder construye todo el
+# árbol de widgets (márgenes, entry, botones de acción) en una sola pasada
+# nativa en lugar de una llamada PyGObject por propiedad y por widget
+_PAY_DIALOG_UI = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <template class="PayBalanceDialog" parent="GtkDialog">
+    <property name="modal">True</property>
+    <property name="hide-on-close">True</property>
+    <signal name="response" handler="_on_response"/>
+    <child internal-child="content_area">
+      <object class="GtkBox">
+        <property name="spacing">12</property>
+        <property name="margin-top">12</property>
+        <property name="margin-bottom">12</property>
+        <property name="margin-start">12</property>
+        <property name="margin-end">12</property>
+        <child>
+          <object class="GtkLabel" id="lbl_importe">
+            <property name="xalign">0</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkEntry" id="entry_importe">
+            <property name="placeholder-text">0.00</property>
+            <property name="activates-default">True</property>
+            <property name="input-purpose">number</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child type="action">
+      <object class="GtkButton" id="btn_cancel"/>
+    </child>
+    <child type="action">
+      <object class="GtkButton" id="btn_pay">
+        <style>
+          <class name="suggested-action"/>
+        </style>
+      </object>
+    </child>
+    <property name="default-widget">btn_pay</property>
+    <action-widgets>
+      <action-widget response="cancel">btn_cancel</action-widget>
+      <action-widget response="ok">btn_pay</action-widget>
+    </action-widgets>
+  </template>
+</interface>
+"""
+
+
+@Gtk.Template(string=_PAY_DIALOG_UI)
+class PayBalanceDialog(Gtk.Dialog):
+    """
+    Diálogo de pagar saldo definido como plantilla de GtkBuilder.
+
+    La estructura (content area con márgenes, entry del importe y botones
+    Cancel/Pay) vive en el XML _PAY_DIALOG_UI y la construye el parser C
+    de GTK de una vez. Los textos visibles se asignan en __init__ porque
+    el idioma se configura en tiempo de ejecución, después de que el XML
+    se haya registrado al importar el módulo.
+
+    La señal "response" también se conecta desde la plantilla (atributo
+    <signal> del XML más el decorador Gtk.Template.Callback), así que el
+    handler es un método normal del diálogo en lugar de un closure que la
+    vista tendría que conectar a mano tras instanciarlo.
+    """
+
+    __gtype_name__ = 'PayBalanceDialog'
+
+    # Widgets hijos definidos en la plantilla
+    entry_importe = Gtk.Template.Child()
+    lbl_importe = Gtk.Template.Child()
+    btn_cancel = Gtk.Template.Child()
+    btn_pay = Gtk.Template.Child()
+
+    def __init__(self, **kwargs):
+        """Inicializa el diálogo y traduce los textos de la plantilla."""
+        super().__init__(**kwargs)
+        # Callable que recibe el texto del entry cuando el usuario
+        # confirma; lo asigna la vista al crear el diálogo
+        self.on_ok_callback = None
+        self.lbl_importe.set_label(_("Amount to pay:"))
+        self.btn_cancel.set_label(_("Cancel"))
+        self.btn_pay.set_label(_("Pay"))
+
+    @Gtk.Template.Callback()
+    def _on_response(self, dialog, response_id):
+        """
+        Maneja la respuesta del diálogo (conectada desde la plantilla).
+
+        PyGObject pasa siempre el emisor como primer argumento de la
+        señal, aunque el emisor sea el propio objeto de la plantilla, de
+        modo que aquí dialog es self.
+
+        Si el usuario confirma, entrega el texto del entry al callback de
+        la vista, que es quien distingue el campo vacío y parsea el
+        importe (el diálogo no sabe a qué se aplicará el valor).
+        """
+        if response_id == Gtk.ResponseType.OK:
+            cb = self.on_ok_callback
+            if cb:
+                cb(self.entry_importe.get_text())
+        # Ocultar (no destruir) para poder reutilizar el diálogo
+        self.hide()
 
 
 class PantallaInicialView(Gtk.ApplicationWindow):
@@ -96,7 +378,20 @@ class PantallaInicialView(Gtk.ApplicationWindow):
     La vista se comunica con el controlador mediante callbacks que se
     asignan desde el controlador para manejar las acciones del usuario.
     """
-    
+
+    # Callbacks del controlador, guardados como referencias débiles para no
+    # cerrar el ciclo vista<->controlador (ver _WeakCallback). La asignación
+    # y la lectura se hacen igual que con atributos normales
+    on_add_amigo_callback = _WeakCallback()
+    on_eliminar_amigo_callback = _WeakCallback()
+    on_add_gasto_callback = _WeakCallback()
+    on_eliminar_gasto_callback = _WeakCallback()
+    on_actualizar_gasto_callback = _WeakCallback()
+    on_pagar_saldo_callback = _WeakCallback()
+    on_actualizar_callback = _WeakCallback()
+    on_borrar_todos_gastos_callback = _WeakCallback()
+    on_borrar_todos_amigos_callback = _WeakCallback()
+
     def __init__(self, app):
         """
         Inicializa la ventana principal de la aplicación.
@@ -125,12 +420,65 @@ class PantallaInicialView(Gtk.ApplicationWindow):
 
         # Vista para mostrar mensajes de error e información
         self.error_view = ErrorView(self)
-        
-        # Construir la interfaz gráfica
+
+        # Diálogo de agregar/editar gasto. Se construye una sola vez de forma
+        # perezosa y se reutiliza en cada apertura (ver _ensure_dialog_gasto)
+        self._dialog_gasto = None
+        self._gasto_dialog_ctx = None  # Contexto de la apertura actual
+        # Firma (id, nombre) de los amigos mostrados en los checkboxes del
+        # diálogo; si no cambia entre aperturas, se omite la reconciliación
+        self._gasto_amigos_sig = None
+
+        # Diálogo de pagar saldo, también construido una sola vez de forma
+        # perezosa; cada apertura solo cambia el título, vacía el entry y
+        # guarda el amigo al que se aplicará el pago
+        self._pay_dialog = None
+        self._pay_entry = None
+        self._current_pay_amigo_id = None
+
+        # Diálogo de agregar amigo, construido una sola vez con el helper
+        # genérico de diálogos de entrada simple (ver _build_simple_input_dialog)
+        self._add_amigo_dialog = None
+        self._add_amigo_entry = None
+
+        # Filas actualmente mostradas, indexadas por ID. Permiten actualizar
+        # las listas en sitio reutilizando los widgets existentes en lugar de
+        # destruir y recrear todas las filas en cada refresco
+        self._row_by_amigo_id = {}
+        self._row_by_gasto_id = {}
+        # Generación del poblado en curso: cada refresco la incrementa para
+        # cancelar las tandas pendientes de un poblado anterior (ver
+        # _poblar_listbox_en_chunks)
+        self._generacion_poblado = 0
+
+        # Selección actual de cada lista, cacheada desde la señal
+        # row-selected. Los handlers de botón leen estos atributos en lugar
+        # de cruzar la frontera PyGObject con get_selected_row() en cada click
+        self._selected_amigo_id = None
+        self._selected_amigo_nombre = None
+        self._selected_gasto_id = None
+
+        # Modo de efectos reducidos (opcional): con SPLITWITHME_LOW_FX=1 se
+        # desactivan las sombras y transiciones CSS, que añaden trabajo de
+        # renderizado por frame en equipos con render por software o GPU
+        # limitada. Por defecto no se toca el estilo del tema
+        if os.environ.get('SPLITWITHME_LOW_FX') == '1':
+            css = Gtk.CssProvider()
+            datos_css = "* { box-shadow: none; transition: none; }"
+            if hasattr(css, 'load_from_string'):
+                css.load_from_string(datos_css)  # GTK 4.12+
+            else:
+                try:
+                    # GTK 4.9-4.11: load_from_data(texto, longitud)
+                    css.load_from_data(datos_css, -1)
+                except TypeError:
+                    # GTK <= 4.8: load_from_data(bytes)
+                    css.load_from_data(datos_css.encode())
+            Gtk.StyleContext.add_provider_for_display(
+                self.get_display(), css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+
+        # Construir la interfaz gráfica (incluye la UI de carga del header)
         self._construir_interfaz()
-        
-        # Configurar la UI de carga (spinner y label)
-        self._setup_loading_ui()
 
     def _construir_interfaz(self):
         """
@@ -157,9 +505,9 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         # Botón para actualizar/refrescar los datos
         btn_actualizar = Gtk.Button(icon_name="view-refresh-symbolic")
         btn_actualizar.set_tooltip_text(_("Refresh data"))
-        # Conectar el click del botón al callback (si existe)
-        # Usa 'and' para ejecutar el callback solo si no es None
-        btn_actualizar.connect("clicked", lambda w: self.on_actualizar_callback and self.on_actualizar_callback())
+        # Conectar el click del botón al callback (si existe). El walrus
+        # resuelve el atributo una sola vez por click
+        btn_actualizar.connect("clicked", lambda w: (cb := self.on_actualizar_callback) and cb())
         header_bar.pack_start(btn_actualizar)  # Añadir al inicio del header
 
         # Botón para maximizar/restaurar ventana
@@ -169,11 +517,15 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         header_bar.pack_end(self.btn_fullscreen)  # Añadir al final del header
         
         # Elementos de carga: spinner animado y label de estado
-        # Estos se mostrarán durante operaciones asíncronas
+        # Estos se mostrarán durante operaciones asíncronas. Se empaquetan
+        # aquí mismo, con el header_bar a mano, en lugar de volver a
+        # consultar el titlebar en un segundo paso tras la construcción
         self.spinner = Gtk.Spinner()  # Indicador de carga giratorio
         self.status_label = Gtk.Label()  # Label para mostrar mensajes de estado
         self.status_label.set_margin_start(12)  # Margen izquierdo
         self.status_label.set_margin_end(12)    # Margen derecho
+        header_bar.pack_start(self.spinner)       # Spinner al inicio del header
+        header_bar.pack_start(self.status_label)  # Label de estado al inicio del header
 
         # Paned: contenedor dividido que permite redimensionar dos paneles
         # El usuario puede arrastrar el divisor para cambiar el tamaño de cada panel
@@ -181,12 +533,10 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         paned.set_position(400)  # Posición inicial del divisor (400 píxeles desde la izquierda)
         
         # Evita que los paneles se encojan demasiado cuando se redimensiona
-        # Se usa try/except porque algunas versiones de GTK pueden no tener este método
-        try:
+        # (solo si la versión de GTK tiene estos métodos; ver sonda de módulo)
+        if _HAS_SHRINK:
             paned.set_shrink_start_child(False)  # Panel izquierdo no se encoge
             paned.set_shrink_end_child(False)    # Panel derecho no se encoge
-        except Exception:
-            pass  # Si no está disponible, continuar sin esta funcionalidad
         main_box.append(paned)  # Añadir el paned al contenedor principal
 
         # Panel izquierdo: Amigos
@@ -207,23 +557,35 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         # Ventana desplazable para la lista de amigos
         # Permite hacer scroll si hay muchos amigos
         scroll_amigos = Gtk.ScrolledWindow(vexpand=True, hscrollbar_policy=Gtk.PolicyType.NEVER)
-        # ListBox: lista de filas seleccionables (una a la vez)
-        self.listbox_amigos = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        # ListBox: lista de filas seleccionables (una a la vez).
+        # activate-on-single-click desactivado: por defecto row-activated
+        # se emite en cada click simple, y aquí la activación debe
+        # reservarse al doble click o Enter (el click simple solo selecciona)
+        self.listbox_amigos = Gtk.ListBox(
+            selection_mode=Gtk.SelectionMode.SINGLE, activate_on_single_click=False)
+        # Cachear la selección cuando cambia (ver _on_amigo_row_selected)
+        self.listbox_amigos.connect("row-selected", self._on_amigo_row_selected)
+        # Doble click / Enter sobre una fila abre el diálogo de pago; la
+        # señal ya entrega la fila, sin consultar la selección
+        self.listbox_amigos.connect("row-activated", self._on_amigo_row_activated)
         scroll_amigos.set_child(self.listbox_amigos)  # Lista dentro de la ventana desplazable
         panel_amigos.append(scroll_amigos)
 
         # Botones de acción para amigos (eliminar, pagar saldo, borrar todos)
         box_acciones_amigos = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6, halign=Gtk.Align.CENTER) # Contenedor horizontal para los botones
-        btn_eliminar_amigo = Gtk.Button(label=_("Delete friend"))
-        btn_pagar_saldo = Gtk.Button(label=_("Pay balance"))
+        # Los botones que dependen de la selección se guardan como atributos:
+        # _on_amigo_row_selected les activa/desactiva la sensibilidad, de
+        # modo que el click sin selección ni siquiera entra en Python
+        self.btn_eliminar_amigo = Gtk.Button(label=_("Delete friend"), sensitive=False)
+        self.btn_pagar_saldo = Gtk.Button(label=_("Pay balance"), sensitive=False)
         btn_borrar_todos_amigos = Gtk.Button(label=_("Delete all"))
 
         # Conectar cada botón a su respectivo handler
-        btn_eliminar_amigo.connect("clicked", self._on_btn_eliminar_amigo_clicked) 
-        btn_pagar_saldo.connect("clicked", self._on_btn_pagar_saldo_clicked)
+        self.btn_eliminar_amigo.connect("clicked", self._on_btn_eliminar_amigo_clicked)
+        self.btn_pagar_saldo.connect("clicked", self._on_btn_pagar_saldo_clicked)
         btn_borrar_todos_amigos.connect("clicked", self._on_btn_borrar_todos_amigos_clicked)
-        box_acciones_amigos.append(btn_eliminar_amigo)
-        box_acciones_amigos.append(btn_pagar_saldo)
+        box_acciones_amigos.append(self.btn_eliminar_amigo)
+        box_acciones_amigos.append(self.btn_pagar_saldo)
         box_acciones_amigos.append(btn_borrar_todos_amigos)
         panel_amigos.append(box_acciones_amigos)
 
@@ -246,34 +608,26 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         scroll_gastos = Gtk.ScrolledWindow(vexpand=True, hscrollbar_policy=Gtk.PolicyType.NEVER)
         # ListBox para mostrar los gastos (selección única)
         self.listbox_gastos = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        # Cachear la selección cuando cambia (ver _on_gasto_row_selected)
+        self.listbox_gastos.connect("row-selected", self._on_gasto_row_selected)
         scroll_gastos.set_child(self.listbox_gastos)
         panel_gastos.append(scroll_gastos)
 
         # Botones de acción para gastos (editar, eliminar, borrar todos)
         box_acciones_gastos = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6, halign=Gtk.Align.CENTER)
-        btn_editar_gasto = Gtk.Button(label=_("Edit expense"))
-        btn_eliminar_gasto = Gtk.Button(label=_("Delete expense"))
+        # Sensibilidad ligada a la selección, igual que en el panel de amigos
+        self.btn_editar_gasto = Gtk.Button(label=_("Edit expense"), sensitive=False)
+        self.btn_eliminar_gasto = Gtk.Button(label=_("Delete expense"), sensitive=False)
         btn_borrar_todos = Gtk.Button(label=_("Delete all"))
         # Conectar cada botón a su handler
-        btn_editar_gasto.connect("clicked", self._on_btn_editar_gasto_clicked)
-        btn_eliminar_gasto.connect("clicked", self._on_btn_eliminar_gasto_clicked)
+        self.btn_editar_gasto.connect("clicked", self._on_btn_editar_gasto_clicked)
+        self.btn_eliminar_gasto.connect("clicked", self._on_btn_eliminar_gasto_clicked)
         btn_borrar_todos.connect("clicked", self._on_btn_borrar_todos_clicked)
-        box_acciones_gastos.append(btn_editar_gasto)
-        box_acciones_gastos.append(btn_eliminar_gasto)
+        box_acciones_gastos.append(self.btn_editar_gasto)
+        box_acciones_gastos.append(self.btn_eliminar_gasto)
         box_acciones_gastos.append(btn_borrar_todos)
         panel_gastos.append(box_acciones_gastos)
     
-    def _setup_loading_ui(self):
-        """
-        Configura los elementos de carga en el HeaderBar.
-        
-        Añade el spinner y el label de estado al HeaderBar para que
-        se muestren durante las operaciones asíncronas.
-        """
-        header_bar = self.get_titlebar()
-        header_bar.pack_start(self.spinner)      # Añadir spinner al inicio del header
-        header_bar.pack_start(self.status_label)  # Añadir label de estado al inicio del header
-    
     def mostrar_loading(self, mensaje: str = None):
         """
         Muestra el indicador de carga y un mensaje de estado.
@@ -284,7 +638,7 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         mensaje: Mensaje opcional a mostrar. Si es None, muestra "Loading..."
         """
         if mensaje is None:
-            mensaje = _("Loading...")  # Mensaje por defecto traducido
+            mensaje = _strings()['loading']  # Mensaje por defecto (traducción cacheada)
         self.status_label.set_text(mensaje)  # Establecer el texto del label
         self.spinner.start()  # Iniciar la animación del spinner
     
@@ -304,64 +658,203 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         
         Maneja el click del botón de maximizar/restaurar.
         Cambia el estado de la ventana y actualiza el icono y tooltip del botón.
-        Usa try/except para manejar posibles errores si los métodos no están disponibles.
+        La disponibilidad de maximize/unmaximize se comprueba una vez con la
+        sonda de módulo en lugar de envolver cada llamada en try/except.
         """
         if not self._is_fullscreen:
-            # Maximizar la ventana
-            try:
+            if _HAS_MAXIMIZE:
                 self.maximize()  # Maximizar la ventana
-            except Exception:
-                pass  # Si falla, continuar sin maximizar
             self._is_fullscreen = True  # Actualizar estado interno
             # Cambiar el icono a "restaurar"
-            try:
-                self.btn_fullscreen.set_icon_name("view-restore-symbolic")
-                self.btn_fullscreen.set_tooltip_text(_("Restore"))
-            except Exception:
-                pass
+            self.btn_fullscreen.set_icon_name("view-restore-symbolic")
+            self.btn_fullscreen.set_tooltip_text(_("Restore"))
         else:
-            # Restaurar el tamaño normal de la ventana
-            try:
+            if _HAS_MAXIMIZE:
                 self.unmaximize()  # Restaurar tamaño normal
-            except Exception:
-                pass
             self._is_fullscreen = False  # Actualizar estado interno
             # Cambiar el icono a "maximizar"
-            try:
-                self.btn_fullscreen.set_icon_name("window-maximize-symbolic")
-                self.btn_fullscreen.set_tooltip_text(_("Maximize"))
-            except Exception:
-                pass
+            self.btn_fullscreen.set_icon_name("window-maximize-symbolic")
+            self.btn_fullscreen.set_tooltip_text(_("Maximize"))
 
     def mostrar_pantalla_inicial(self, grupo):
         """
         Actualiza la interfaz con los datos del grupo.
-        
-        Limpia las listas actuales y las rellena con los amigos y gastos
-        del grupo proporcionado. Este método se llama cuando se actualizan
-        los datos del modelo.
-        
+
+        Concilia las listas visibles con los amigos y gastos del grupo:
+        las filas que persisten se actualizan en sitio, las que sobran se
+        eliminan y solo se crean widgets para los elementos nuevos. Este
+        método se llama cuando se actualizan los datos del modelo.
+
         grupo: Objeto Main que contiene la lista de amigos y gastos
         """
-        # Limpiar y actualizar la lista de amigos
+        # Invalidar cualquier poblado en tandas que siga pendiente de un
+        # refresco anterior
+        self._generacion_poblado += 1
+        amigos_by_id = {a.id: a.nombre for a in grupo.amigos}
+
+        # Si las listas parten vacías y hay muchos elementos (carga inicial
+        # o tras un borrado total), poblarlas en tandas dentro del bucle
+        # principal para no congelar la ventana durante la construcción
+        if not self._row_by_amigo_id and len(grupo.amigos) > _FILAS_POR_TICK:
+            self._poblar_listbox_en_chunks(
+                self.listbox_amigos, grupo.amigos,
+                self._crear_fila_amigo, self._row_by_amigo_id)
+        else:
+            self._sincronizar_amigos(grupo.amigos)
+
+        if not self._row_by_gasto_id and len(grupo.gastos) > _FILAS_POR_TICK:
+            self._poblar_listbox_en_chunks(
+                self.listbox_gastos, grupo.gastos,
+                lambda g: self._crear_fila_gasto(g, amigos_by_id),
+                self._row_by_gasto_id)
+        else:
+            self._sincronizar_gastos(grupo.gastos, amigos_by_id)
+
+    def _poblar_listbox_en_chunks(self, listbox, elementos, crear_fila, row_dict):
+        """
+        Rellena un ListBox vacío en tandas dentro del bucle principal.
+
+        Construir todas las filas en una sola pasada síncrona bloquea el
+        bucle de eventos y congela la ventana con grupos grandes. Este
+        método añade _FILAS_POR_TICK filas por tick mediante GLib.idle_add,
+        de modo que GTK puede pintar frames intermedios entre tanda y tanda
+        y la ventana sigue respondiendo. El spinner gira hasta la última tanda.
+
+        listbox: ListBox (vacío) que se va a poblar
+        elementos: Lista de objetos del modelo a mostrar
+        crear_fila: Función que construye la fila de un elemento
+        row_dict: Diccionario {id: fila} que se va rellenando
+        """
+        generacion = self._generacion_poblado
+        iterador = iter(elementos)
+        self.spinner.start()
+
+        def _append_chunk():
+            # Abortar si llegó un refresco más nuevo con las tandas a medias
+            if generacion != self._generacion_poblado:
+                return False
+            anadidos = 0
+            for elemento in iterador:
+                row = crear_fila(elemento)
+                row_dict[elemento.id] = row
+                listbox.append(row)
+                anadidos += 1
+                if anadidos >= _FILAS_POR_TICK:
+                    return True  # Quedan elementos: continuar en el siguiente tick
+            self.spinner.stop()
+            return False  # Iterador agotado: no volver a planificar
+
+        GLib.idle_add(_append_chunk)
+
+    def _sincronizar_amigos(self, amigos):
+        """
+        Concilia en sitio la lista de amigos visible con la del modelo.
+
+        amigos: Lista de amigos del modelo
+        """
+        # Borrado total (tras "Delete all"): vaciar en una sola llamada en
+        # lugar de eliminar las filas una por una
+        if not amigos and self._row_by_amigo_id:
+            self.limpiar_amigos()
+            return
+        # Sincronizar la lista de amigos reutilizando las filas existentes:
+        # primero se eliminan las filas cuyo amigo ya no está, después se
+        # actualizan en sitio las que persisten y se insertan solo las nuevas
+        ids_amigos = {a.id for a in amigos}
+        # Si la composición cambia, ocultar el listbox durante la mutación en
+        # bloque: cada insert/remove sobre un listbox visible dispara una
+        # pasada de medida/asignación; oculto, el layout se aplaza a una
+        # única pasada final. (freeze/thaw_child_notify era API de GTK3)
+        cambia_amigos = self._row_by_amigo_id.keys() != ids_amigos
+        if cambia_amigos:
+            self.listbox_amigos.set_visible(False)
+        for amigo_id in list(self._row_by_amigo_id):
+            if amigo_id not in ids_amigos:
+                self.listbox_amigos.remove(self._row_by_amigo_id.pop(amigo_id))
+        for pos, amigo in enumerate(amigos):
+            row = self._row_by_amigo_id.get(amigo.id)
+            if row is not None:
+                # Fila existente: basta con refrescar los textos
+                self._actualizar_fila_amigo(row, amigo)
+            else:
+                row = self._crear_fila_amigo(amigo)
+                self._row_by_amigo_id[amigo.id] = row
+                self.listbox_amigos.insert(row, pos)
+        if cambia_amigos:
+            self.listbox_amigos.set_visible(True)
+            self.listbox_amigos.queue_resize()  # Una sola pasada de layout
+
+    def _sincronizar_gastos(self, gastos, amigos_by_id):
+        """
+        Concilia en sitio la lista de gastos visible con la del modelo.
+
+        gastos: Lista de gastos del modelo
+        amigos_by_id: Diccionario {id: nombre} para resolver el pagador
+        """
+        # Borrado total (tras "Delete all"): vaciar en una sola llamada
+        if not gastos and self._row_by_gasto_id:
+            self.limpiar_gastos()
+            return
+        # Misma estrategia que _sincronizar_amigos: eliminar las filas
+        # sobrantes, refrescar en sitio las que persisten e insertar las nuevas
+        ids_gastos = {g.id for g in gastos}
+        cambia_gastos = self._row_by_gasto_id.keys() != ids_gastos
+        if cambia_gastos:
+            self.listbox_gastos.set_visible(False)
+        for gasto_id in list(self._row_by_gasto_id):
+            if gasto_id not in ids_gastos:
+                self.listbox_gastos.remove(self._row_by_gasto_id.pop(gasto_id))
+        for pos, gasto in enumerate(gastos):
+            row = self._row_by_gasto_id.get(gasto.id)
+            if row is not None:
+                self._actualizar_fila_gasto(row, gasto, amigos_by_id)
+            else:
+                row = self._crear_fila_gasto(gasto, amigos_by_id)
+                self._row_by_gasto_id[gasto.id] = row
+                self.listbox_gastos.insert(row, pos)
+        if cambia_gastos:
+            self.listbox_gastos.set_visible(True)
+            self.listbox_gastos.queue_resize()  # Una sola pasada de layout
+
+    def limpiar_amigos(self):
+        """
+        Vacía la lista de amigos en una sola operación.
+
+        Usa remove_all() (vía _limpiar_listbox) para desmontar todas las
+        filas en una única llamada nativa, en lugar de N llamadas remove()
+        con sus N emisiones de señal. También descarta el índice de filas
+        y la selección cacheada, que dejan de ser válidos.
+        """
         self._limpiar_listbox(self.listbox_amigos)
-        for amigo in grupo.amigos:
-            self.listbox_amigos.append(self._crear_fila_amigo(amigo))
+        self._row_by_amigo_id.clear()
+        self._selected_amigo_id = None
+        self._selected_amigo_nombre = None
 
-        # Limpiar y actualizar la lista de gastos
+    def limpiar_gastos(self):
+        """
+        Vacía la lista de gastos en una sola operación.
+
+        Misma estrategia que limpiar_amigos: una única llamada nativa en
+        lugar de un remove() por fila.
+        """
         self._limpiar_listbox(self.listbox_gastos)
-        for gasto in grupo.gastos:
-            self.listbox_gastos.append(self._crear_fila_gasto(gasto, grupo.amigos))
+        self._row_by_gasto_id.clear()
+        self._selected_gasto_id = None
 
     def _limpiar_listbox(self, listbox):
         """
         Elimina todas las filas de un ListBox.
-        
-        Itera sobre las filas del ListBox y las elimina una por una
-        hasta que no queden más filas.
-        
+
+        Usa remove_all() (GTK 4.12+) si está disponible, que desmonta
+        todas las filas en una sola pasada; en versiones anteriores las
+        elimina una por una.
+
         listbox: El ListBox que se desea limpiar
         """
+        if hasattr(listbox, 'remove_all'):
+            # Una sola invalidación en lugar de una por fila
+            listbox.remove_all()
+            return
         # Operador walrus (:=): asigna y evalúa en la misma expresión
         # Mientras hay una fila en el índice 0, la elimina
         while row := listbox.get_row_at_index(0):
@@ -378,398 +871,546 @@ class PantallaInicialView(Gtk.ApplicationWindow):
         Retorna: ListBoxRow configurado con la información del amigo
         """
         row = Gtk.ListBoxRow()  # Fila de la lista
-        # Guardar datos del amigo en el row para acceso posterior
-        row.amigo_id = amigo.id
-        row.amigo_nombre = amigo.nombre
+        row.amigo_id = amigo.id  # Guardar ID del amigo para acceso posterior
 
-        # Contenedor vertical para los labels
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_top=8, margin_bottom=8, margin_start=12, margin_end=12)
-        
-        # Label con el nombre en negrita (usando markup HTML)
-        lbl_nombre = Gtk.Label(label=f"<b>{amigo.nombre}</b>", use_markup=True, xalign=0)
-        
-        # Calcular y formatear el saldo
-        saldo = amigo.saldo()
-        # Corregir -0.00 para mostrar 0.00 (evita mostrar valores negativos casi cero)
-        if abs(saldo) < 0.01:
-            saldo = 0.0
-        saldo_texto = _("Balance: {amount}").format(amount=format_currency(saldo))  # Formatear como moneda
-        lbl_saldo = Gtk.Label(label=saldo_texto, xalign=0)
-        
-        # Añadir los labels al contenedor
-        box.append(lbl_nombre)
-        box.append(lbl_saldo)
+        # Contenedor para los labels. Se usa Gtk.Grid en lugar de Gtk.Box:
+        # Box renegocia el espacio sobrante entre sus hijos con llamadas
+        # extra a measure() en cada asignación de tamaño, mientras que Grid
+        # resuelve la columna en una sola pasada
+        box = Gtk.Grid(row_spacing=4, margin_top=8, margin_bottom=8, margin_start=12, margin_end=12)
+
+        # Labels del nombre (en negrita) y del saldo. Se guardan como
+        # atributos del row para poder refrescar sus textos en sitio
+        row.lbl_nombre = Gtk.Label(xalign=0)
+        row.lbl_nombre.set_attributes(_BOLD_ATTRS)  # Negrita sin parsear markup
+        row.lbl_saldo = _crear_texto_fila("")
+
+        # Colocar los labels en la única columna del grid
+        box.attach(row.lbl_nombre, 0, 0, 1, 1)
+        box.attach(row.lbl_saldo, 0, 1, 1, 1)
         row.set_child(box)  # Establecer el contenedor como hijo del row
+
+        # Rellenar los textos con los datos del amigo
+        self._actualizar_fila_amigo(row, amigo)
         return row
 
-    def _crear_fila_gasto(self, gasto, amigos=None):
+    def _actualizar_fila_amigo(self, row, amigo):
+        """
+        Refresca los textos de una fila de amigo existente.
+
+        Solo actualiza los labels y los datos guardados en el row, sin
+        crear ni re-parentar widgets. Es el camino caliente del refresco
+        cuando la lista de amigos no cambia de composición.
+        """
+        row.amigo_nombre = amigo.nombre
+        # Label con el nombre (la negrita la aplica el AttrList precalculado)
+        row.lbl_nombre.set_text(amigo.nombre)
+
+        # Calcular y formatear el saldo solo si no está cacheado en el modelo
+        # (el modelo invalida la caché cuando el saldo cambia)
+        if amigo._fmt_saldo is None:
+            saldo = amigo.saldo()
+            # Corregir -0.00 para mostrar 0.00 (evita mostrar valores negativos casi cero)
+            if abs(saldo) < 0.01:
+                saldo = 0.0
+            amigo._fmt_saldo = format_currency(saldo)  # Formatear como moneda
+        row.lbl_saldo.set_text(_strings()['balance'].format(amount=amigo._fmt_saldo))
+
+    def _crear_fila_gasto(self, gasto, amigos_by_id=None):
         """
         Crea una fila visual para mostrar un gasto en la lista.
-        
+
         Crea un ListBoxRow con la descripción, monto, fecha, división
-        por persona y el nombre del pagador. Busca el nombre del pagador
-        en la lista de amigos si está disponible.
-        
+        por persona y el nombre del pagador. El nombre del pagador se
+        busca en el diccionario {id: nombre} si está disponible.
+
         Retorna: ListBoxRow configurado con la información del gasto
         """
         row = Gtk.ListBoxRow()  # Fila de la lista
         row.gasto_id = gasto.id  # Guardar ID del gasto para acceso posterior
 
-        # Contenedor vertical para todos los labels
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_top=8, margin_bottom=8, margin_start=12, margin_end=12)
-        
-        # Label con la descripción en negrita
-        lbl_desc = Gtk.Label(label=f"<b>{gasto.descripcion}</b>", use_markup=True, xalign=0)
-        # Label con monto y fecha formateados
-        lbl_info = Gtk.Label(label=f"{format_currency(gasto.monto)} - {format_date(gasto.fecha)}", xalign=0)
-        
-        # Buscar el nombre del pagador si está disponible
-        pagador_nombre = _("Unknown")  # Valor por defecto si no se encuentra
-        if hasattr(gasto, 'pagador_id') and gasto.pagador_id and amigos:
-            # Buscar el nombre del pagador en la lista de amigos
-            for amigo in amigos:
-                if amigo.id == gasto.pagador_id:
-                    pagador_nombre = amigo.nombre
-                    break  # Salir del loop cuando se encuentra
-        
-        # Calcular la división del gasto por persona
-        division = gasto.split()
-        lbl_div = Gtk.Label(label=_("Per person: {amount} ({count} people)").format(amount=format_currency(division), count=gasto.num_friends), xalign=0)
-        lbl_pagador = Gtk.Label(label=_("Paid by: {name}").format(name=pagador_nombre), xalign=0)
-
-        # Añadir todos los labels al contenedor
-        box.append(lbl_desc)
-        box.append(lbl_info)
-        box.append(lbl_div)
-        box.append(lbl_pagador)
+        # Contenedor para todos los labels (Grid por el mismo motivo que en
+        # _crear_fila_amigo: evita las renegociaciones de measure() de Box)
+        box = Gtk.Grid(row_spacing=4, margin_top=8, margin_bottom=8, margin_start=12, margin_end=12)
+
+        # Labels de la fila, guardados como atributos del row para poder
+        # refrescar sus textos en sitio en actualizaciones posteriores
+        row.lbl_desc = Gtk.Label(xalign=0)
+        row.lbl_desc.set_attributes(_BOLD_ATTRS)  # Negrita sin parsear markup
+        row.lbl_info = _crear_texto_fila("")
+        row.lbl_div = _crear_texto_fila("")
+        row.lbl_pagador = _crear_texto_fila("")
+
+        # Colocar todos los labels en la única columna del grid
+        box.attach(row.lbl_desc, 0, 0, 1, 1)
+        box.attach(row.lbl_info, 0, 1, 1, 1)
+        box.attach(row.lbl_div, 0, 2, 1, 1)
+        box.attach(row.lbl_pagador, 0, 3, 1, 1)
         row.set_child(box)  # Establecer el contenedor como hijo del row
+
+        # Rellenar los textos con los datos del gasto
+        self._actualizar_fila_gasto(row, gasto, amigos_by_id)
         return row
 
-    def mostrar_dialogo_add_amigo(self):
+    def _actualizar_fila_gasto(self, row, gasto, amigos_by_id=None):
         """
-        Muestra un diálogo para agregar un nuevo amigo.
-        
-        Crea un diálogo modal con un campo de entrada de texto para
-        introducir el nombre del amigo. Cuando el usuario hace clic
-        en "Add", llama al callback del controlador con el nombre.
-        """
-        # Crear diálogo modal para agregar amigo
-        dialog = Gtk.Dialog(transient_for=self, modal=True, title=_("Add friend"))
-        content = dialog.get_content_area()  # Área de contenido del diálogo
-        content.set_spacing(12)              # Espaciado entre widgets
-        content.set_margin_top(12)
-        content.set_margin_bottom(12)
-        content.set_margin_start(12)
-        content.set_margin_end(12)
-
-        # Campo de entrada de texto para el nombre
-        entry_nombre = Gtk.Entry(placeholder_text=_("Enter name"))
-        content.append(Gtk.Label(label=_("Friend name:"), xalign=0))  # Label descriptivo
-        content.append(entry_nombre)
-
-        # Añadir botones al diálogo (Cancel y Add)
+        Refresca los textos de una fila de gasto existente.
+
+        Solo actualiza los labels del row, sin crear ni re-parentar
+        widgets. Es el camino caliente del refresco cuando la lista de
+        gastos no cambia de composición.
+        """
+        strings = _strings()  # Plantillas traducidas una sola vez
+        # Label con la descripción (la negrita la aplica el AttrList precalculado)
+        row.lbl_desc.set_text(gasto.descripcion)
+
+        # Formatear monto, fecha y división solo si no están cacheados en el
+        # modelo (el modelo invalida la caché cuando el gasto se edita)
+        if gasto._fmt_monto is None:
+            gasto._fmt_monto = format_currency(gasto.monto)
+            gasto._fmt_fecha = format_date(gasto.fecha)
+            gasto._fmt_division = format_currency(gasto.split())
+
+        # Label con monto y fecha formateados
+        row.lbl_info.set_text(f"{gasto._fmt_monto} - {gasto._fmt_fecha}")
+
+        # Buscar el nombre del pagador si está disponible. Gasto siempre
+        # inicializa pagador_id (None por defecto), así que no hace falta
+        # sondear el atributo con hasattr en cada fila
+        pagador_nombre = strings['unknown']  # Valor por defecto si no se encuentra
+        if gasto.pagador_id is not None and amigos_by_id:
+            # Búsqueda O(1) en el diccionario precalculado
+            pagador_nombre = amigos_by_id.get(gasto.pagador_id, pagador_nombre)
+
+        # División del gasto por persona (texto cacheado en el modelo)
+        row.lbl_div.set_text(strings['per_person'].format(amount=gasto._fmt_division, count=gasto.num_friends))
+        row.lbl_pagador.set_text(strings['paid_by'].format(name=pagador_nombre))
+
+    @staticmethod
+    def _preparar_content_area(dialog):
+        """
+        Aplica el espaciado y los márgenes estándar (12px) al área de
+        contenido de un diálogo y la devuelve. Todos los diálogos de la
+        aplicación comparten esta misma geometría.
+        """
+        content = dialog.get_content_area()
+        # set_properties asigna las cinco propiedades en una sola llamada
+        # nativa (g_object_set), en lugar de cinco setters PyGObject con
+        # su notificación de propiedad cada uno
+        content.set_properties(
+            spacing=12, margin_top=12, margin_bottom=12,
+            margin_start=12, margin_end=12)
+        return content
+
+    def _build_simple_input_dialog(self, titulo, etiqueta, placeholder, on_ok, ok_label):
+        """
+        Construye un diálogo modal con un único campo de texto.
+
+        Factoriza el patrón que repetían los diálogos de entrada simple:
+        content area con la geometría estándar, label + entry, botones
+        Cancel/acción y handler de respuesta que entrega el texto. El
+        diálogo se oculta (no se destruye) al responder, así que el
+        llamador puede cachearlo y reutilizarlo.
+
+        on_ok: Callable que recibe el texto del entry (sin espacios en
+               los extremos) cuando el usuario confirma
+        Retorna: Tupla (dialog, entry)
+        """
+        dialog = Gtk.Dialog(transient_for=self, modal=True, title=titulo)
+        # Cerrar con Esc o desde el gestor de ventanas debe ocultar, no
+        # destruir: el diálogo cacheado tiene que seguir siendo válido
+        dialog.set_hide_on_close(True)
+        content = self._preparar_content_area(dialog)
+
+        # activates-default: Enter dentro del entry dispara el botón por
+        # defecto, de modo que teclado y click comparten el mismo camino de
+        # respuesta en lugar de dos rutas distintas
+        entry = Gtk.Entry(placeholder_text=placeholder, activates_default=True)
+        content.append(Gtk.Label(label=etiqueta, xalign=0))
+        content.append(entry)
+
         dialog.add_button(_("Cancel"), Gtk.ResponseType.CANCEL)
-        dialog.add_button(_("Add"), Gtk.ResponseType.OK)
-        
+        btn_ok = dialog.add_button(ok_label, Gtk.ResponseType.OK)
+        btn_ok.add_css_class("suggested-action")
+        dialog.set_default_widget(btn_ok)
+
         def on_response(d, response_id):
-            """
-            Maneja la respuesta del diálogo.
-            
-            Si el usuario hace clic en OK, obtiene el nombre del campo
-            y llama al callback del controlador.
-            """
             if response_id == Gtk.ResponseType.OK:
-                nombre = entry_nombre.get_text().strip()  # Obtener y limpiar el texto
-                if self.on_add_amigo_callback:
-                    self.on_add_amigo_callback(nombre)  # Llamar al callback del controlador
-            d.close()  # Cerrar el diálogo
+                on_ok(entry.get_text().strip())
+            d.hide()  # Ocultar (no destruir) para poder reutilizarlo
+
+        dialog.connect("response", on_response)
+        return dialog, entry
+
+    def mostrar_dialogo_add_amigo(self):
+        """
+        Muestra el diálogo para agregar un nuevo amigo.
+
+        El diálogo (un campo de texto para el nombre) se construye una
+        sola vez con el helper genérico y se reutiliza en cada apertura;
+        al confirmar se llama al callback del controlador con el nombre.
+        """
+        if self._add_amigo_dialog is None:
+            def on_ok(nombre):
+                cb = self.on_add_amigo_callback
+                if cb:
+                    cb(nombre)
+
+            self._add_amigo_dialog, self._add_amigo_entry = self._build_simple_input_dialog(
+                _("Add friend"), _("Friend name:"), _("Enter name"), on_ok, _("Add"))
 
-        dialog.connect("response", on_response)  # Conectar el evento de respuesta
-        dialog.present()  # Mostrar el diálogo
+        self._add_amigo_entry.set_text("")  # Entry vacío en cada apertura
+        self._add_amigo_dialog.present()
+
+    def _ensure_dialog_gasto(self):
+        """
+        Construye el diálogo de agregar/editar gasto si aún no existe.
+
+        El diálogo y todos sus widgets (entradas, combo del pagador, lista de
+        checkboxes) se crean una única vez y se guardan en atributos de la
+        vista. Las aperturas posteriores solo actualizan el contenido y la
+        visibilidad de cada bloque, evitando recrear ~N widgets (uno por
+        amigo) en cada apertura.
+        """
+        if self._dialog_gasto is not None:
+            return
+
+        # Crear diálogo modal con ancho por defecto
+        dialog = Gtk.Dialog(transient_for=self, modal=True, default_width=400)
+        # Igual que los demás diálogos cacheados: Esc o el cierre del
+        # gestor de ventanas ocultan el diálogo en lugar de destruirlo
+        dialog.set_hide_on_close(True)
+        content = self._preparar_content_area(dialog)
+
+        # Campos de entrada: descripción y monto (visibles en ambos modos).
+        # Con activates-default, Enter en cualquier entry dispara el botón
+        # OK por la misma ruta de respuesta que un click
+        self._gasto_entry_desc = Gtk.Entry(activates_default=True)
+        # input-purpose NUMBER: los métodos de entrada y teclados en
+        # pantalla ofrecen directamente el teclado numérico
+        self._gasto_entry_monto = Gtk.Entry(
+            activates_default=True, input_purpose=Gtk.InputPurpose.NUMBER)
+        content.append(Gtk.Label(label=_("Description:"), xalign=0))
+        content.append(self._gasto_entry_desc)
+        content.append(Gtk.Label(label=_("Amount:"), xalign=0))
+        content.append(self._gasto_entry_monto)
+
+        # Bloque de fecha (solo visible en modo edición)
+        self._gasto_lbl_fecha = Gtk.Label(label=_("Date (YYYY-MM-DD):"), xalign=0)
+        self._gasto_entry_fecha = Gtk.Entry(activates_default=True)
+        content.append(self._gasto_lbl_fecha)
+        content.append(self._gasto_entry_fecha)
+
+        # Bloque de pagador (solo visible en modo creación)
+        self._gasto_lbl_pagador = Gtk.Label(label=_("Who paid?"), xalign=0)
+        self._gasto_combo_pagador = Gtk.DropDown.new_from_strings([])
+        content.append(self._gasto_lbl_pagador)
+        content.append(self._gasto_combo_pagador)
+
+        # Lista de checkboxes de participantes (el texto del label cambia
+        # según el modo). Los CheckButtons se reutilizan entre aperturas.
+        # FlowBox en lugar de Box vertical: coloca varios checkboxes por
+        # línea, con lo que el diálogo necesita menos filas de layout y
+        # menos scroll con grupos grandes
+        self._gasto_lbl_participantes = Gtk.Label(label=_("Participants:"), xalign=0)
+        self._gasto_box_checks = Gtk.FlowBox(
+            selection_mode=Gtk.SelectionMode.NONE,
+            min_children_per_line=2, max_children_per_line=4,
+            row_spacing=6, column_spacing=12
+        )
+        scroll = Gtk.ScrolledWindow(min_content_height=150, hscrollbar_policy=Gtk.PolicyType.NEVER)
+        scroll.set_child(self._gasto_box_checks)
+        self._gasto_checks = []
+        content.append(self._gasto_lbl_participantes)
+        content.append(scroll)
+
+        # Añadir botones al diálogo (el label del botón OK cambia según el modo)
+        dialog.add_button(_("Cancel"), Gtk.ResponseType.CANCEL)
+        self._gasto_btn_ok = dialog.add_button(_("Add"), Gtk.ResponseType.OK)
+        self._gasto_btn_ok.add_css_class("suggested-action")
+        dialog.set_default_widget(self._gasto_btn_ok)
+
+        # Conectar el evento de respuesta una única vez; el contexto de cada
+        # apertura (modo, gasto, amigos) se guarda en self._gasto_dialog_ctx
+        dialog.connect("response", self._on_gasto_dialog_response)
+        self._dialog_gasto = dialog
+
+    def _reconciliar_checks_gasto(self, amigos, activos_ids):
+        """
+        Sincroniza la lista de checkboxes del diálogo con los amigos actuales.
+
+        Reutiliza los CheckButtons existentes (actualizando label, ID y estado
+        activo), crea solo los que falten si la lista de amigos creció y
+        oculta los sobrantes si se encogió.
+
+        amigos: Lista de amigos a mostrar
+        activos_ids: Conjunto de IDs que deben aparecer marcados
+        """
+        for i, amigo in enumerate(amigos):
+            if i < len(self._gasto_checks):
+                # Reutilizar el checkbox existente
+                check = self._gasto_checks[i]
+                check.set_label(amigo.nombre)
+                check.set_visible(True)
+                check.get_parent().set_visible(True)  # FlowBoxChild contenedor
+            else:
+                # La lista de amigos creció: crear un checkbox nuevo
+                check = Gtk.CheckButton(label=amigo.nombre)
+                self._gasto_box_checks.append(check)
+                self._gasto_checks.append(check)
+            check.amigo_id = amigo.id  # Guardar ID para acceso posterior
+            check.set_active(amigo.id in activos_ids)
+
+        # Ocultar los checkboxes sobrantes de aperturas anteriores (también
+        # su FlowBoxChild, para que no quede el hueco en el layout)
+        for check in self._gasto_checks[len(amigos):]:
+            check.set_visible(False)
+            check.get_parent().set_visible(False)
+
+    def _on_gasto_dialog_response(self, dialog, response_id):
+        """
+        Maneja la respuesta del diálogo de gasto (conectado una sola vez).
+
+        Si el usuario hace clic en OK, recopila todos los datos y llama al
+        callback apropiado del controlador (crear o actualizar) según el
+        contexto guardado en la apertura.
+        """
+        ctx = self._gasto_dialog_ctx
+        if response_id == Gtk.ResponseType.OK and ctx is not None:
+            descripcion = self._gasto_entry_desc.get_text().strip()
+            # Sin strip(): el controlador lo valida con float(), que ya
+            # tolera espacios en los extremos
+            monto_str = self._gasto_entry_monto.get_text()
+
+            # IDs seleccionados entre los checkboxes visibles
+            seleccionados = [cb.amigo_id for cb in self._gasto_checks
+                             if cb.get_visible() and cb.get_active()]
+
+            if ctx["es_edicion"]:
+                # Modo edición: recopilar datos y llamar al callback de actualización
+                fecha = self._gasto_entry_fecha.get_text().strip()
+                # Crear diccionario con los datos del gasto editado
+                datos = {
+                    "descripcion": descripcion,
+                    "monto_str": monto_str,
+                    "fecha": fecha,
+                    "participantes_ids": seleccionados
+                }
+                if self.on_actualizar_gasto_callback:
+                    self.on_actualizar_gasto_callback(ctx["gasto"].id, datos)
+            else:
+                # Modo creación: obtener pagador y deudores y llamar al
+                # callback capturado al abrir el diálogo
+                pagador_idx = self._gasto_combo_pagador.get_selected()
+                pagador_id = ctx["amigos"][pagador_idx].id  # ID del pagador
+                if ctx["add_callback"]:
+                    ctx["add_callback"](descripcion, monto_str, pagador_id, seleccionados)
+        # Ocultar (no destruir) para poder reutilizar el diálogo
+        dialog.hide()
 
     def mostrar_dialogo_gasto(self, amigos, gasto_a_editar=None, participantes_ids=None):
         """
-        Muestra un diálogo para agregar o editar un gasto.
-        
-        Este diálogo cambia su contenido dependiendo de si se está agregando
-        un nuevo gasto o editando uno existente.
-        
+        Muestra el diálogo para agregar o editar un gasto.
+
+        El diálogo se construye una sola vez (ver _ensure_dialog_gasto) y
+        cambia su contenido dependiendo de si se está agregando un nuevo
+        gasto o editando uno existente.
+
         Para agregar:
         - Campo de descripción
         - Campo de monto
         - Combo box para seleccionar quién pagó
         - Checkboxes para seleccionar quiénes participaron
-        
+
         Para editar:
         - Campos prellenados con los datos actuales
         - Campo de fecha editable
         - Checkboxes para editar los participantes
-        
+
         amigos: Lista de amigos disponibles
         gasto_a_editar: Gasto existente si se está editando, None si es nuevo
         participantes_ids: Lista de IDs de participantes (solo para edición)
         """
-        # Determinar si es edición o creación
+        self._ensure_dialog_gasto()
+
+        # Determinar si es edición o creación. Los textos que dependen del
+        # modo salen de la caché de traducciones en vez de llamar a _() en
+        # cada apertura
+        strings = _strings()
         es_edicion = gasto_a_editar is not None
-        titulo = _("Edit expense") if es_edicion else _("Add expense")
+        self._dialog_gasto.set_title(strings['edit_expense'] if es_edicion else strings['add_expense'])
+        self._gasto_btn_ok.set_label(strings['save'] if es_edicion else strings['add'])
 
-        # Crear diálogo modal con ancho por defecto
-        dialog = Gtk.Dialog(transient_for=self, modal=True, title=titulo, default_width=400)
-        content = dialog.get_content_area()
-        content.set_spacing(12)
-        content.set_margin_top(12)
-        content.set_margin_bottom(12)
-        content.set_margin_start(12)
-        content.set_margin_end(12)
+        # Prellenar los campos (vacíos en modo creación)
+        self._gasto_entry_desc.set_text(gasto_a_editar.descripcion if es_edicion else "")
+        self._gasto_entry_monto.set_text(str(gasto_a_editar.monto) if es_edicion else "")
+        self._gasto_entry_fecha.set_text(gasto_a_editar.fecha if es_edicion else "")
 
-        # Campos de entrada: descripción y monto
-        # Si es edición, prellenar con los valores actuales
-        entry_desc = Gtk.Entry(text=gasto_a_editar.descripcion if es_edicion else "")
-        entry_monto = Gtk.Entry(text=str(gasto_a_editar.monto) if es_edicion else "")
+        # Mostrar/ocultar los bloques específicos de cada modo
+        self._gasto_lbl_fecha.set_visible(es_edicion)
+        self._gasto_entry_fecha.set_visible(es_edicion)
+        self._gasto_lbl_pagador.set_visible(not es_edicion)
+        self._gasto_combo_pagador.set_visible(not es_edicion)
+        self._gasto_lbl_participantes.set_label(
+            strings['participants'] if es_edicion else strings['who_participated'])
 
-        content.append(Gtk.Label(label=_("Description:"), xalign=0))
-        content.append(entry_desc)
-        content.append(Gtk.Label(label=_("Amount:"), xalign=0))
-        content.append(entry_monto)
-
-        if es_edicion:
-            # Modo edición: añadir campo de fecha y lista de participantes
-            entry_fecha = Gtk.Entry(text=gasto_a_editar.fecha)
-            content.append(Gtk.Label(label=_("Date (YYYY-MM-DD):"), xalign=0))
-            content.append(entry_fecha)
-            
-            # Lista de checkboxes para editar participantes
-            content.append(Gtk.Label(label=_("Participants:"), xalign=0))
-            box_participantes = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            scroll_participantes = Gtk.ScrolledWindow(min_content_height=150, hscrollbar_policy=Gtk.PolicyType.NEVER)
-            scroll_participantes.set_child(box_participantes)
-            checkboxes_participantes = []
-            # Crear un checkbox por cada amigo, marcado si está en participantes_ids
-            for amigo in amigos:
-                check = Gtk.CheckButton(label=amigo.nombre, active=(amigo.id in (participantes_ids or [])))
-                check.amigo_id = amigo.id  # Guardar ID para acceso posterior
-                box_participantes.append(check)
-                checkboxes_participantes.append(check)
-            content.append(scroll_participantes)
+        if not es_edicion:
+            # Modo creación: poblar el combo del pagador con los nombres
+            nombres_amigos = [a.nombre for a in amigos]
+            self._gasto_combo_pagador.set_model(Gtk.StringList.new(nombres_amigos))
+
+        # Sincronizar los checkboxes con la lista de amigos actual
+        # (marcados según los participantes en modo edición, sin marcar si es nuevo)
+        activos_ids = set(participantes_ids or []) if es_edicion else set()
+        sig = tuple((a.id, a.nombre) for a in amigos)
+        if sig == self._gasto_amigos_sig:
+            # La lista de amigos no cambió desde la última apertura: basta
+            # con resetear el estado activo de los checkboxes visibles
+            for check in self._gasto_checks[:len(amigos)]:
+                check.set_active(check.amigo_id in activos_ids)
         else:
-            # Modo creación: añadir combo box para pagador y checkboxes para deudores
-            nombres_amigos = []
-            for a in amigos:
-                nombres_amigos.append(a.nombre)
-            # DropDown para seleccionar quién pagó
-            combo_pagador = Gtk.DropDown.new_from_strings(nombres_amigos)
-            content.append(Gtk.Label(label=_("Who paid?"), xalign=0))
-            content.append(combo_pagador)
-            
-            # Lista de checkboxes para seleccionar quiénes participaron
-            box_deudores = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            scroll = Gtk.ScrolledWindow(min_content_height=150, hscrollbar_policy=Gtk.PolicyType.NEVER)
-            scroll.set_child(box_deudores)
-            checkboxes = []
-            # Crear un checkbox por cada amigo, sin marcar por defecto
-            for amigo in amigos:
-                check = Gtk.CheckButton(label=amigo.nombre, active=False)
-                check.amigo_id = amigo.id  # Guardar ID para acceso posterior
-                box_deudores.append(check)
-                checkboxes.append(check)
-            content.append(Gtk.Label(label=_("Who participated?"), xalign=0))
-            content.append(scroll)
-        
-        # Añadir botones al diálogo
-        dialog.add_button(_("Cancel"), Gtk.ResponseType.CANCEL)
-        dialog.add_button(_("Save") if es_edicion else _("Add"), Gtk.ResponseType.OK)
+            self._reconciliar_checks_gasto(amigos, activos_ids)
+            self._gasto_amigos_sig = sig
 
-        # Guardar referencia al callback original antes de que se modifique
-        # (puede ser necesario si el callback cambia durante la ejecución)
-        callback_original = self.on_add_gasto_callback
-        
-        def on_response(d, response_id):
-            """
-            Maneja la respuesta del diálogo.
-            
-            Si el usuario hace clic en OK, recopila todos los datos
-            y llama al callback apropiado del controlador (crear o actualizar).
-            """
-            if response_id == Gtk.ResponseType.OK:
-                descripcion = entry_desc.get_text().strip()
-                monto_str = entry_monto.get_text().strip()
-
-                if es_edicion:
-                    # Modo edición: recopilar datos y llamar al callback de actualización
-                    fecha = entry_fecha.get_text().strip()
-                    # Obtener participantes seleccionados de los checkboxes
-                    participantes_seleccionados = []
-                    for cb in checkboxes_participantes:
-                        if cb.get_active():
-                            participantes_seleccionados.append(cb.amigo_id)
-                    
-                    # Crear diccionario con los datos del gasto editado
-                    datos = {
-                        "descripcion": descripcion, 
-                        "monto_str": monto_str, 
-                        "fecha": fecha,
-                        "participantes_ids": participantes_seleccionados
-                    }
-                    if self.on_actualizar_gasto_callback:
-                        self.on_actualizar_gasto_callback(gasto_a_editar.id, datos)
-                else:
-                    # Modo creación: obtener pagador y deudores y llamar al callback de creación
-                    pagador_idx = combo_pagador.get_selected()  # Índice del pagador seleccionado
-                    pagador_id = amigos[pagador_idx].id  # ID del pagador
-                    deudores_ids = []
-                    # Obtener IDs de los deudores seleccionados
-                    for cb in checkboxes:
-                        if cb.get_active():
-                            deudores_ids.append(cb.amigo_id)
-                    # Llamar al callback original de creación
-                    if callback_original:
-                        callback_original(descripcion, monto_str, pagador_id, deudores_ids)
-            d.close()  # Cerrar el diálogo
-
-        dialog.connect("response", on_response)  # Conectar el evento de respuesta
-        dialog.present()  # Mostrar el diálogo
-    
-    def mostrar_dialogo_editar(self, gasto, participantes_ids=None, amigos=None):
-        """
-        Alias para mantener compatibilidad con el código existente.
-        
-        Este método simplemente llama a mostrar_dialogo_gasto con
-        los parámetros en un orden diferente para facilitar la migración.
-        """
-        self.mostrar_dialogo_gasto(amigos, gasto, participantes_ids)
+        # Guardar el contexto que usará el handler de respuesta. El callback
+        # de creación se captura aquí porque el controlador lo sustituye
+        # temporalmente mientras el diálogo está abierto
+        self._gasto_dialog_ctx = {
+            "es_edicion": es_edicion,
+            "gasto": gasto_a_editar,
+            "amigos": amigos,
+            "add_callback": self.on_add_gasto_callback,
+        }
+        self._dialog_gasto.present()  # Mostrar el diálogo
 
-    def mostrar_dialogo_pagar_saldo(self, amigo_nombre):
-        """
-        Muestra un diálogo para registrar un pago de saldo de un amigo.
-        
-        Permite al usuario introducir un importe que se pagará para
-        reducir el saldo negativo (deuda) de un amigo.
-        
-        amigo_nombre: Nombre del amigo cuyo saldo se va a pagar
+    def _ensure_pay_dialog(self):
         """
-        # Crear diálogo modal con el nombre del amigo en el título
-        dialog = Gtk.Dialog(transient_for=self, modal=True, title=_("Pay balance of {name}").format(name=amigo_nombre))
-        content = dialog.get_content_area()
-        content.set_spacing(12)
-        content.set_margin_top(12)
-        content.set_margin_bottom(12)
-        content.set_margin_start(12)
-        content.set_margin_end(12)
-        
-        # Campo de entrada para el importe a pagar
-        entry_importe = Gtk.Entry(placeholder_text="0.00")
-        content.append(Gtk.Label(label=_("Amount to pay:"), xalign=0))
-        content.append(entry_importe)
-        
-        # Añadir botones al diálogo
-        dialog.add_button(_("Cancel"), Gtk.ResponseType.CANCEL)
-        dialog.add_button(_("Pay"), Gtk.ResponseType.OK)
-        
-        def on_response(d, response_id):
-            """
-            Maneja la respuesta del diálogo.
-            
-            Si el usuario hace clic en OK, obtiene el importe y el amigo
-            seleccionado, y llama al callback del controlador.
-            """
-            if response_id == Gtk.ResponseType.OK:
-                importe_str = entry_importe.get_text().strip()  # Obtener importe introducido
-                row = self.listbox_amigos.get_selected_row()  # Obtener amigo seleccionado
-                if row and self.on_pagar_saldo_callback:
-                    # Llamar al callback con el ID del amigo y el importe
-                    self.on_pagar_saldo_callback(row.amigo_id, importe_str)
-            d.close()  # Cerrar el diálogo
-        
-        dialog.connect("response", on_response)  # Conectar el evento de respuesta
-        dialog.present()  # Mostrar el diálogo
+        Construye el diálogo de pagar saldo si aún no existe.
 
-    # Callbacks de botones
-    # Estos métodos son llamados cuando el usuario hace clic en los botones de la interfaz
-    # Cada método obtiene la información necesaria y llama al callback del controlador
-    
-    def _on_btn_add_amigo_clicked(self, button):
+        El diálogo, el entry del importe y los botones se crean una sola
+        vez; cada apertura posterior solo actualiza título y contenido
+        (ver mostrar_dialogo_pagar_saldo).
         """
-        Maneja el click del botón de agregar amigo.
-        
-        Muestra el diálogo para introducir el nombre del nuevo amigo.
-        """
-        self.mostrar_dialogo_add_amigo()
-    
-    def _on_btn_eliminar_amigo_clicked(self, button):
-        """
-        Maneja el click del botón de eliminar amigo.
-        
-        Obtiene el amigo seleccionado en la lista y llama al callback
-        del controlador para eliminarlo. Solo actúa si hay una fila seleccionada.
+        if self._pay_dialog is not None:
+            return
+
+        # El árbol de widgets lo construye la plantilla de GtkBuilder en una
+        # sola pasada nativa (ver PayBalanceDialog); el título se fija en
+        # cada apertura
+        dialog = PayBalanceDialog(transient_for=self)
+        self._pay_entry = dialog.entry_importe
+
+        # La señal "response" ya viene conectada desde la plantilla; aquí
+        # solo se registra a quién entregar el importe confirmado
+        dialog.on_ok_callback = self._on_pay_confirmado
+        self._pay_dialog = dialog
+
+    def _on_pay_confirmado(self, texto):
         """
-        row = self.listbox_amigos.get_selected_row()  # Obtener fila seleccionada
-        if row and self.on_eliminar_amigo_callback:
-            # Llamar al callback con el ID del amigo seleccionado
-            self.on_eliminar_amigo_callback(row.amigo_id)
+        Recibe el texto confirmado en el diálogo de pagar saldo.
 
-    def _on_btn_eliminar_gasto_clicked(self, button):
+        Un campo vacío se avisa aquí mismo con su mensaje dedicado, sin
+        molestar al controlador: no hay nada que procesar. Con texto, se
+        parsea el importe y se entrega ya tipado (float, o None si no es
+        un número; se acepta la coma como separador decimal) al
+        controlador junto con el amigo capturado al abrir el diálogo.
         """
-        Maneja el click del botón de eliminar gasto.
-        
-        Obtiene el gasto seleccionado en la lista y llama al callback
-        del controlador para eliminarlo. Solo actúa si hay una fila seleccionada.
+        if not texto or texto.isspace():
+            self.error_view.mostrar_error(_("You must enter an amount"))
+            return
+        # Sin strip(): float() ya tolera espacios en los extremos
+        try:
+            importe = float(texto.replace(',', '.'))
+        except ValueError:
+            importe = None
+        cb = self.on_pagar_saldo_callback
+        if self._current_pay_amigo_id is not None and cb:
+            cb(self._current_pay_amigo_id, importe)
+
+    def mostrar_dialogo_pagar_saldo(self, amigo_id, amigo_nombre):
         """
-        row = self.listbox_gastos.get_selected_row()  # Obtener fila seleccionada
-        if row and self.on_eliminar_gasto_callback:
-            # Llamar al callback con el ID del gasto seleccionado
-            self.on_eliminar_gasto_callback(row.gasto_id)
-    
-    def _on_btn_editar_gasto_clicked(self, button):
+        Muestra el diálogo para registrar un pago de saldo de un amigo.
+
+        Permite al usuario introducir un importe que se pagará para
+        reducir el saldo negativo (deuda) de un amigo. El diálogo se
+        construye una sola vez y se reutiliza en cada apertura. Es el
+        punto de entrada único de la acción de pago: lo comparten el
+        botón "Pagar saldo" y la activación de una fila de la lista.
+
+        amigo_id: ID del amigo cuyo saldo se va a pagar
+        amigo_nombre: Nombre del amigo (para el título del diálogo)
         """
-        Maneja el click del botón de editar gasto.
-        
-        Obtiene el gasto seleccionado y llama al callback del controlador
-        para editarlo. El controlador se encargará de cargar los datos
-        y mostrar el diálogo de edición.
-        """
-        row = self.listbox_gastos.get_selected_row()  # Obtener fila seleccionada
-        if row and self.on_actualizar_gasto_callback:
-            # Llamar al callback con el ID del gasto para cargar y editar
-            self.on_actualizar_gasto_callback(row.gasto_id)
-    
-    def _on_btn_add_gasto_clicked(self, button):
+        self._ensure_pay_dialog()
+        # Título con el nombre del amigo (plantilla traducida cacheada) y
+        # entry vacío en cada apertura
+        self._pay_dialog.set_title(_strings()['pay_title'].format(name=amigo_nombre))
+        self._pay_entry.set_text("")
+        # Amigo al que se aplicará el pago (la selección no puede cambiar
+        # mientras el diálogo modal está abierto)
+        self._current_pay_amigo_id = amigo_id
+        self._pay_dialog.present()
+
+    # Handlers de selección de las listas
+    # Cachean la fila seleccionada para que los handlers de botón no tengan
+    # que llamar a get_selected_row() (dos cruces de la frontera PyGObject)
+
+    def _on_amigo_row_selected(self, listbox, row):
         """
-        Maneja el click del botón de agregar gasto.
-        
-        Llama al callback del controlador que se encargará de mostrar
-        el diálogo para crear un nuevo gasto.
+        Cachea el amigo seleccionado cuando cambia la selección.
+
+        row: Fila seleccionada, o None si se deseleccionó
         """
-        if self.on_add_gasto_callback:
-            self.on_add_gasto_callback()
-    
-    def _on_btn_borrar_todos_clicked(self, button):
+        self._selected_amigo_id = row.amigo_id if row else None
+        self._selected_amigo_nombre = row.amigo_nombre if row else None
+        # Activar los botones que requieren selección solo cuando la hay;
+        # sin selección el click se descarta en C sin entrar en Python
+        sensible = row is not None
+        self.btn_eliminar_amigo.set_sensitive(sensible)
+        self.btn_pagar_saldo.set_sensitive(sensible)
+
+    def _on_gasto_row_selected(self, listbox, row):
         """
-        Maneja el click del botón de borrar todos los gastos.
-        
-        Llama al callback del controlador para eliminar todos los gastos.
-        El controlador debería mostrar una confirmación antes de proceder.
+        Cachea el gasto seleccionado cuando cambia la selección.
+
+        row: Fila seleccionada, o None si se deseleccionó
         """
-        if self.on_borrar_todos_gastos_callback:
-            self.on_borrar_todos_gastos_callback()
-    
+        self._selected_gasto_id = row.gasto_id if row else None
+        # Igual que con los amigos: sensibilidad ligada a la selección
+        sensible = row is not None
+        self.btn_editar_gasto.set_sensitive(sensible)
+        self.btn_eliminar_gasto.set_sensitive(sensible)
+
+    # Callbacks de botones: llaman al callback del controlador o abren el
+    # diálogo correspondiente
+
+    def _on_btn_add_amigo_clicked(self, button):
+        """Maneja el click del botón de agregar amigo: abre su diálogo."""
+        self.mostrar_dialogo_add_amigo()
+
+
+    # Handlers generados desde una tabla declarativa: todos comparten la
+    # forma "leer callback, leer selección cacheada (si aplica), llamar",
+    # así que _crear_handler_boton fabrica cada uno a partir de esta tupla
+    # (nombre del botón, atributo del callback, atributo de la selección).
+    # Los handlers que abren diálogos (add_amigo, pagar_saldo) no encajan
+    # en el patrón y siguen escritos a mano más abajo
+    _BTN_HANDLERS = (
+        ('eliminar_amigo', 'on_eliminar_amigo_callback', '_selected_amigo_id'),
+        ('eliminar_gasto', 'on_eliminar_gasto_callback', '_selected_gasto_id'),
+        ('editar_gasto', 'on_actualizar_gasto_callback', '_selected_gasto_id'),
+        ('add_gasto', 'on_add_gasto_callback', None),
+        ('borrar_todos', 'on_borrar_todos_gastos_callback', None),
+        ('borrar_todos_amigos', 'on_borrar_todos_amigos_callback', None),
+    )
+    for _nombre, _cb_attr, _sel_attr in _BTN_HANDLERS:
+        locals()[f'_on_btn_{_nombre}_clicked'] = _crear_handler_boton(_nombre, _cb_attr, _sel_attr)
+    del _nombre, _cb_attr, _sel_attr
+
     def _on_btn_pagar_saldo_clicked(self, button):
-        """
-        Maneja el click del botón de pagar saldo.
-        
-        Obtiene el amigo seleccionado y muestra el diálogo para introducir
-        el importe a pagar. Solo actúa si hay un amigo seleccionado.
-        """
-        row = self.listbox_amigos.get_selected_row()  # Obtener fila seleccionada
-        if row:
-            # Mostrar diálogo con el nombre del amigo seleccionado
-            self.mostrar_dialogo_pagar_saldo(row.amigo_nombre)
-    
-    def _on_btn_borrar_todos_amigos_clicked(self, button):
-        """
-        Maneja el click del botón de borrar todos los amigos.
-        
-        Llama al callback del controlador para eliminar todos los amigos.
-        El controlador debería mostrar una confirmación antes de proceder.
-        """
-        if self.on_borrar_todos_amigos_callback:
-            self.on_borrar_todos_amigos_callback()
\ No newline at end of file
+        """Maneja el click del botón de pagar saldo (usa la selección cacheada)."""
+        if self._selected_amigo_id is not None:
+            self.mostrar_dialogo_pagar_saldo(self._selected_amigo_id, self._selected_amigo_nombre)
+
+    def _on_amigo_row_activated(self, listbox, row):
+        """Abre el diálogo de pago al activar (doble click/Enter) una fila de amigo."""
+        self.mostrar_dialogo_pagar_saldo(row.amigo_id, row.amigo_nombre)
\ No newline at end of file